@@ -0,0 +1,61 @@
+# src/core/chaos.py
+import asyncio
+import random
+from enum import Enum
+
+import structlog
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+logger = structlog.get_logger(__name__)
+
+
+class Fault(str, Enum):
+    """Kind of fault injected by the fault injector."""
+
+    TIMEOUT = "timeout"  # Step hits its playwright timeout
+    NETWORK = "network"  # Connection drops mid-request
+    SLOW = "slow"  # Step succeeds, but late
+
+
+class FaultInjector:
+    """
+    Inject seeded, reproducible faults into the scraping steps.
+
+    Meant for exercising the retry, circuit breaker, deadline and fallback
+    paths on purpose. Each ``maybe_inject`` call fails with probability
+    ``rate``; the same seed yields the same sequence of faults.
+    """
+
+    SLOW_DELAY = 5.0  # seconds
+
+    def __init__(self, rate: float, seed: int = 0) -> None:
+        """Initialize injector with fault probability and seed."""
+        self.rate = rate
+        self._random = random.Random(seed)  # noqa: S311
+        self._logger = logger.bind(component="FaultInjector")
+
+    async def maybe_inject(self, point: str) -> None:
+        """
+        Possibly inject a fault at the given point.
+
+        Args:
+            point: Name of the step, used in logs and error messages
+
+        Raises:
+            PlaywrightTimeoutError: For an injected timeout
+            PlaywrightError: For an injected network failure
+        """
+        if self._random.random() >= self.rate:
+            return
+
+        fault = self._random.choice(list(Fault))
+        self._logger.warning("Injecting fault", point=point, fault=fault.value)
+        if fault is Fault.SLOW:
+            await asyncio.sleep(self.SLOW_DELAY)
+            return
+
+        error_message = f"Injected {fault.value} fault at {point}"
+        if fault is Fault.TIMEOUT:
+            raise PlaywrightTimeoutError(error_message)
+        raise PlaywrightError(error_message)
@@ -0,0 +1,106 @@
+# src/core/circuit_breaker.py
+import time
+from enum import Enum
+
+from src.core.exceptions import ApplicationError
+
+
+class CircuitOpenError(ApplicationError):
+    """Raised when a call is short-circuited by an open circuit breaker."""
+
+    CIRCUIT_OPEN = "Circuit open for {}, next attempt allowed in {:.0f}s"
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # Calls go through
+    OPEN = "open"  # Calls fail immediately
+    HALF_OPEN = "half_open"  # One probe call is let through
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing backend until it had time to recover.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    ``check`` raises at once instead of letting the caller wait for yet
+    another timeout. Once ``recovery_timeout`` has passed a single probe call
+    is let through: success closes the breaker, failure opens it again. A
+    probe that never reports back is given up on after another
+    ``recovery_timeout``.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, recovery_timeout: float = 60.0
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_started_at: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the breaker."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def check(self) -> None:
+        """
+        Make sure a call may be attempted.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+
+        now = time.monotonic()
+        if state is CircuitState.OPEN:
+            retry_in = self.recovery_timeout - (now - self._opened_at)
+        elif (
+            self._probe_started_at is not None
+            and now - self._probe_started_at < self.recovery_timeout
+        ):
+            # Another caller is already probing the backend
+            retry_in = self.recovery_timeout - (now - self._probe_started_at)
+        else:
+            self._probe_started_at = now
+            return
+        raise CircuitOpenError(
+            CircuitOpenError.CIRCUIT_OPEN.format(self.name, retry_in)
+        )
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker past the threshold."""
+        self._failures += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+        self._probe_started_at = None
+
+
+# One breaker per backend, so an outage of one host does not block another
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for a backend."""
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name)
+    return _breakers[name]
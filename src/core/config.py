@@ -1,11 +1,16 @@
 """Configuration module for the application."""
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 
+ROOT_DIR = Path(__file__).parent.parent.parent
+ENV_FILE = ROOT_DIR / ".env"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -21,6 +26,10 @@ class Settings(BaseSettings):
     mtuci_password: str = Field(..., description="MTUCI account password")
     mtuci_base_url: str = Field(..., description="MTUCI base URL")
     mtuci_schedule_url: str = Field(..., description="MTUCI schedule page URL")
+    mtuci_storage_state_path: Path = Field(
+        default=Path("mtuci_state.json"),
+        description="Path to the saved MTUCI browser session",
+    )
 
     # Google Calendar Configuration
     google_calendar_id: str = Field(..., description="Google Calendar ID")
@@ -36,6 +45,11 @@ class Settings(BaseSettings):
         default="МТУСИ Расписание",
         description="Name of the Google Calendar",
     )
+    google_max_concurrency: int = Field(
+        default=5,
+        ge=1,
+        description="Maximum number of concurrent Google Calendar API requests",
+    )
 
     # Scraping Configuration
     scraping_max_retries: int = Field(
@@ -52,3 +66,44 @@ class Settings(BaseSettings):
     scraping_default_group: str = Field(
         description="Default group for schedule",
     )
+    scraping_concurrency: int = Field(
+        default=3,
+        ge=1,
+        description="Number of browser pages parsing dates in parallel",
+    )
+    scraping_max_concurrent_runs: int = Field(
+        default=2,
+        ge=1,
+        description="Number of schedule scrapes allowed to run at once",
+    )
+    scraping_total_timeout_ms: int = Field(
+        default=600_000,
+        ge=1,
+        description="Deadline for the whole schedule scrape, retries included",
+    )
+    scraping_fault_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Probability of injecting a fault into a scraping step",
+    )
+    scraping_fault_seed: int = Field(
+        default=0,
+        description="Seed for reproducible fault injection",
+    )
+    scraping_debug: bool = Field(
+        default=False,
+        description="Run a visible, slowed-down browser for debugging",
+    )
+
+    # Logging Configuration
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
+        default="INFO",
+        description="Minimum level of emitted log records",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the project ``.env`` file once and reuse them."""
+    return Settings(_env_file=ENV_FILE)
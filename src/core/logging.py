@@ -1,22 +1,32 @@
 # src/core/logging.py
+import logging
+
+import orjson
 import structlog
+from structlog.typing import FilteringBoundLogger
 
 
-def configure_logging() -> None:
+def configure_logging(level: int = logging.INFO) -> None:
     """Configure structured logging for the application."""
 
     structlog.configure(
         processors=[
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.stdlib.add_log_level,
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.add_log_level,
+            # UTC skips the local timezone conversion on every call
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            # Keep frame locals out of the output, they may hold credentials
+            structlog.processors.ExceptionRenderer(
+                structlog.tracebacks.ExceptionDictTransformer(show_locals=False)
+            ),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps, default=str),
         ],
-        wrapper_class=structlog.BoundLogger,
+        # Calls below ``level`` are compiled into no-ops
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.BytesLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str) -> structlog.BoundLogger:
+def get_logger(name: str) -> FilteringBoundLogger:
     """Get a configured logger instance."""
     return structlog.get_logger(name)
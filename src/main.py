@@ -1,13 +1,15 @@
 """Main application module for MTUCI schedule synchronization."""
 
+from __future__ import annotations
+
 import asyncio
-from pathlib import Path
+import logging
+from typing import TYPE_CHECKING
 
-from playwright.async_api import Browser
-from playwright.async_api import Page
 from playwright.async_api import async_playwright
 
-from src.core.config import Settings
+from src.core.chaos import FaultInjector
+from src.core.config import get_settings
 from src.core.exceptions import SYNC_FAILED
 from src.core.exceptions import ApplicationError
 from src.core.exceptions import BrowserSetupError
@@ -19,13 +21,27 @@ from src.my_calendar.google import GoogleCalendarService
 from src.scraping.auth import AuthConfig
 from src.scraping.schedule_scraper import MTUCIScheduleScraper
 
-ROOT_DIR = Path(__file__).parent.parent
-ENV_FILE = ROOT_DIR / ".env"
+if TYPE_CHECKING:
+    from playwright.async_api import Browser
+    from playwright.async_api import Page
+    from playwright.async_api import Route
 
-# Initialize logging
+# Initialize logging, ScheduleSyncApp applies the configured level once settings load
 configure_logging()
 logger = get_logger(__name__)
 
+# The schedule is rendered client-side, so we still need a browser, but not
+# the images/fonts/media it would otherwise download
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for resources that are not needed to read the schedule."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class ScheduleSyncApp:
     """
@@ -38,19 +54,26 @@ class ScheduleSyncApp:
     def __init__(self) -> None:
         """Initialize application with configuration and services."""
         try:
-            self.settings = Settings(env_file=ENV_FILE)
+            self.settings = get_settings()
+            self._configure_logging()
             self._init_configs()
             self._init_services()
         except Exception as e:
             logger.exception("Application initialization failed", error=str(e))
             raise InitializationError from e
 
+    def _configure_logging(self) -> None:
+        """Apply the configured log level, always DEBUG in scraping debug mode."""
+        level = "DEBUG" if self.settings.scraping_debug else self.settings.log_level
+        configure_logging(logging.getLevelNamesMapping()[level])
+
     def _init_configs(self) -> None:
         """Initialize configuration objects for auth and calendar."""
         self.auth_config = AuthConfig(
             email=self.settings.mtuci_email,
             password=self.settings.mtuci_password,
             login_url=f"{self.settings.mtuci_base_url}/auth/login",
+            storage_state_path=str(self.settings.mtuci_storage_state_path),
         )
 
         self.calendar_config = CalendarConfig(
@@ -58,6 +81,7 @@ class ScheduleSyncApp:
             calendar_id=self.settings.google_calendar_id,
             calendar_name=self.settings.google_calendar_name,
             token_path=str(self.settings.google_token_path),
+            max_concurrency=self.settings.google_max_concurrency,
         )
 
     def _init_services(self) -> None:
@@ -67,7 +91,15 @@ class ScheduleSyncApp:
             auth_config=self.auth_config,
             max_retries=self.settings.scraping_max_retries,
             timeout_ms=self.settings.scraping_timeout_ms,
+            max_concurrent_pages=self.settings.scraping_concurrency,
+            total_timeout_ms=self.settings.scraping_total_timeout_ms,
         )
+        self.scraper.max_concurrent_runs = self.settings.scraping_max_concurrent_runs
+        if self.settings.scraping_fault_rate:
+            self.scraper.fault_injector = FaultInjector(
+                rate=self.settings.scraping_fault_rate,
+                seed=self.settings.scraping_fault_seed,
+            )
 
     async def _setup_browser(self) -> tuple[Browser, Page]:
         """
@@ -81,17 +113,22 @@ class ScheduleSyncApp:
         """
         try:
             playwright = await async_playwright().start()
+            debug = self.settings.scraping_debug
             browser = await playwright.chromium.launch(
-                headless=False,
+                headless=not debug,
                 args=["--no-sandbox", "--disable-setuid-sandbox"],
-                slow_mo=50,
+                slow_mo=50 if debug else 0,
             )
+            # Restore the previous session, if any, to skip the login form
+            storage_state = self.settings.mtuci_storage_state_path
             context = await browser.new_context(
+                storage_state=storage_state if storage_state.exists() else None,
                 viewport={"width": 1920, "height": 1080},
                 user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) " "AppleWebKit/537.36"
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 ),
             )
+            await context.route("**/*", _block_heavy_resources)
             return browser, await context.new_page()
 
         except Exception as e:
@@ -1,9 +1,16 @@
 # src/models/schedule.py
+from bisect import insort
+from dataclasses import dataclass
+from datetime import date
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
+from typing import Any
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
 
 
 class ModelValidationError(ValueError):
@@ -17,6 +24,20 @@ class ModelValidationError(ValueError):
     INVALID_WEEK = "Week number must be between 1 and 52"
 
 
+# JSON schema examples, only used when a schema is generated
+SCHEDULE_EVENT_EXAMPLE = {
+    "subject": "Высшая математика",
+    "teacher": "Лакерник Александр Рафаилович",
+    "lesson_type": "Лекция",
+    "location": {"building": "Н", "room": "310"},
+    "start_time": "2024-02-12T09:30:00",
+    "end_time": "2024-02-12T11:05:00",
+    "group": "БИК2404",
+    "subgroup": 1,
+}
+WEEK_SCHEDULE_EXAMPLE = {"events": [], "week_number": 1, "is_even_week": False}
+
+
 class LessonType(str, Enum):
     """Type of the lesson."""
 
@@ -25,68 +46,71 @@ class LessonType(str, Enum):
     LAB = "Лабораторная работа"
 
 
-class Location(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Location:
     """Location of the lesson."""
 
-    building: str = Field(..., description="Building number or name")
-    room: str = Field(..., description="Room number")
+    building: str  # Building number or name
+    room: str  # Room number
 
     def __str__(self) -> str:
         """String representation of location."""
         return f"{self.building}, ауд. {self.room}"
 
 
-class ScheduleEvent(BaseModel):
-    """Schedule event model representing a single lesson."""
+@dataclass(slots=True, frozen=True)
+class ScheduleEvent:
+    """
+    Schedule event model representing a single lesson.
+
+    A plain slotted dataclass rather than a pydantic model: the scraper builds
+    many of these from already typed values, so per-instance validation and
+    ``__dict__`` overhead buy nothing.
+    """
 
-    subject: str = Field(..., description="Name of the subject")
-    teacher: str = Field(..., description="Name of the teacher")
-    lesson_type: LessonType = Field(..., description="Type of the lesson")
-    location: Location = Field(..., description="Location of the lesson")
-    start_time: datetime = Field(..., description="Start time of the lesson")
-    end_time: datetime = Field(..., description="End time of the lesson")
-    group: str = Field(..., description="Student group")
-    subgroup: int | None = Field(None, description="Subgroup number if applicable")
+    subject: str  # Name of the subject
+    teacher: str  # Name of the teacher
+    lesson_type: LessonType
+    location: Location
+    start_time: datetime
+    end_time: datetime
+    group: str  # Student group
+    subgroup: int | None = None  # Subgroup number if applicable
 
-    class Config:
-        """Pydantic model configuration."""
+    # Picked up by pydantic when the event is nested in a model
+    __pydantic_config__ = ConfigDict(
+        json_schema_extra={"example": SCHEDULE_EVENT_EXAMPLE}
+    )
 
-        json_schema_extra = {
-            "example": {
-                "subject": "Высшая математика",
-                "teacher": "Лакерник Александр Рафаилович",
-                "lesson_type": "Лекция",
-                "location": {"building": "Н", "room": "310"},
-                "start_time": "2024-02-12T09:30:00",
-                "end_time": "2024-02-12T11:05:00",
-                "group": "БИК2404",
-                "subgroup": 1,
-            }
-        }
+
+_by_start_time = attrgetter("start_time")
 
 
 class WeekSchedule(BaseModel):
     """Weekly schedule containing multiple events."""
 
+    model_config = ConfigDict(json_schema_extra={"example": WEEK_SCHEDULE_EXAMPLE})
+
     events: list[ScheduleEvent] = Field(default_factory=list)
     week_number: int = Field(..., ge=1, le=52, description="Week number")
     is_even_week: bool = Field(..., description="Whether this is an even week")
 
+    # Events bucketed by calendar day, each bucket sorted by start time
+    _by_day: dict[date, list[ScheduleEvent]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Index events passed to the constructor."""
+        self.events.sort(key=_by_start_time)
+        for event in self.events:
+            self._by_day.setdefault(event.start_time.date(), []).append(event)
+
     def add_event(self, event: ScheduleEvent) -> None:
         """Add event to schedule."""
-        self.events.append(event)
-        # Sort events by start time
-        self.events.sort(key=lambda x: x.start_time)
+        # Keep events sorted by start time without re-sorting the whole list
+        insort(self.events, event, key=_by_start_time)
+        day_events = self._by_day.setdefault(event.start_time.date(), [])
+        insort(day_events, event, key=_by_start_time)
 
     def get_events_for_day(self, date: datetime) -> list[ScheduleEvent]:
         """Get all events for specific date."""
-        return [
-            event for event in self.events if event.start_time.date() == date.date()
-        ]
-
-    class Config:
-        """Pydantic model configuration."""
-
-        json_schema_extra = {
-            "example": {"events": [], "week_number": 1, "is_even_week": False}
-        }
+        return list(self._by_day.get(date.date(), ()))
@@ -1,25 +1,61 @@
 # src/calendar/google.py
 
-from http import HTTPStatus
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import ClassVar
 
 import structlog
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import Resource
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from pydantic import BaseModel
 from pydantic import EmailStr
+from pydantic import Field
 
 from src.core.exceptions import ApplicationError
 from src.models.schedule import LessonType
 from src.models.schedule import ScheduleEvent
 
+if TYPE_CHECKING:
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import Resource
+    from googleapiclient.http import HttpRequest
+
 logger = structlog.get_logger(__name__)
 
+CALENDAR_TIMEZONE = "Europe/Moscow"
+HTTP_NOT_FOUND = 404
+
+# Invariant event body fragments, shared by every event body we build
+EVENT_REMINDERS = {
+    "useDefault": False,
+    "overrides": [
+        {"method": "popup", "minutes": 15},
+    ],
+}
+# https://developers.google.com/calendar/api/v3/reference/colors/get
+LESSON_TYPE_COLORS = {
+    LessonType.LECTURE: "9",  # Blueberry
+    LessonType.PRACTICE: "10",  # Basil
+    LessonType.LAB: "7",  # Peacock
+}
+DEFAULT_EVENT_COLOR = "1"  # Lavender
+# Marks events created by this tool in their private extended properties
+EVENT_SOURCE = "mtuci_sync"
+
+# Process-wide credentials, keyed by (credentials path, token path, scopes)
+_credentials_cache: dict[tuple[str, str, tuple[str, ...]], Credentials] = {}
+_credentials_lock = threading.Lock()
+
 
 class CalendarErrors:
     SERVICE_NOT_INITIALIZED = "Service not initialized"
@@ -33,17 +69,28 @@ class CalendarConfig(BaseModel):
     token_path: str = "token.json"
     calendar_id: EmailStr
     calendar_name: str = "МТУСИ Расписание"
+    # Upper bound of in-flight API requests, keeps us under the QPS quota
+    max_concurrency: int = Field(default=5, ge=1)
+    # How long a verified calendar ID is trusted without asking the API again
+    calendar_verify_ttl_days: int = Field(default=7, ge=0)
 
 
 class GoogleCalendarService:
     """Service for Google Calendar integration."""
 
     SCOPES = ["https://www.googleapis.com/auth/calendar"]
+    # Google Calendar API accepts at most 50 calls per batch request
+    BATCH_SIZE = 50
+    # Token refresh transport, shared so its connection pool is reused
+    _auth_request: ClassVar[Request | None] = None
 
     def __init__(self, config: CalendarConfig):
         """Initialize calendar service."""
         self.config = config
         self.service: Resource | None = None
+        self._credentials: Credentials | None = None
+        # One transport per worker thread, kept so connections are reused
+        self._thread_http = threading.local()
         self._logger = logger.bind(calendar_id=config.calendar_id)
         self._calendar_id = config.calendar_id
 
@@ -54,41 +101,18 @@ class GoogleCalendarService:
 
     def initialize(self) -> None:
         """Initialize the Calendar API service and ensure calendar exists."""
+        # Google client libraries take hundreds of ms to import, load them
+        # only when the service is actually used
+        from googleapiclient.discovery import build
+
         try:
-            creds = None
-            token_path = Path(self.config.token_path)
-
-            # Try to load existing token
-            if token_path.exists():
-                try:
-                    creds = Credentials.from_authorized_user_file(
-                        str(token_path), self.SCOPES
-                    )
-                    self._logger.info("Loaded existing credentials")
-                except (ValueError, FileNotFoundError) as e:
-                    self._logger.warning("Failed to load token", error=str(e))
-
-            # If no valid credentials available, let the user log in
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    self._logger.info("Refreshing expired credentials")
-                    creds.refresh(Request())
-                else:
-                    self._logger.info("Starting OAuth2 authorization flow")
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        self.config.credentials_path,
-                        self.SCOPES,
-                        redirect_uri="urn:ietf:wg:oauth:2.0:oob",  # Desktop app flow
-                    )
-                    creds = flow.run_local_server(port=0)
-                    self._logger.info("Authorization completed")
-
-                # Save the credentials for the next run
-                with token_path.open("w") as token:
-                    token.write(creds.to_json())
-                    self._logger.info("Saved new credentials")
-
-            self.service = build("calendar", "v3", credentials=creds)
+            creds = self._get_credentials()
+            self._credentials = creds
+            # build() already reads the discovery document bundled with
+            # googleapiclient, skip the cache lookup it tries before that
+            self.service = build(
+                "calendar", "v3", credentials=creds, cache_discovery=False
+            )
             self._logger.info("Google Calendar service initialized")
 
             # Ensure calendar exists
@@ -102,22 +126,111 @@ class GoogleCalendarService:
                 message="Failed to initialize calendar service", original_error=e
             ) from e
 
+    def _get_credentials(self) -> Credentials:
+        """
+        Get valid credentials, reusing ones already loaded by this process.
+
+        Credentials are cached per credentials/token file and scopes, so
+        re-initializing the service doesn't re-read the token file or repeat
+        a token refresh round-trip while the cached token is still valid.
+        """
+        key = (self.config.credentials_path, self.config.token_path, tuple(self.SCOPES))
+        with _credentials_lock:
+            creds = _credentials_cache.get(key)
+            if creds is None or not creds.valid:
+                creds = self._load_credentials(creds)
+                _credentials_cache[key] = creds
+            return creds
+
+    def _load_credentials(self, creds: Credentials | None) -> Credentials:
+        """Load, refresh or obtain credentials and persist them to the token file."""
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        token_path = Path(self.config.token_path)
+
+        # Try to load existing token
+        if creds is None and token_path.exists():
+            try:
+                creds = Credentials.from_authorized_user_file(
+                    str(token_path), self.SCOPES
+                )
+                self._logger.info("Loaded existing credentials")
+            except (ValueError, FileNotFoundError) as e:
+                self._logger.warning("Failed to load token", error=str(e))
+
+        if creds and creds.valid:
+            return creds
+
+        # If no valid credentials available, let the user log in
+        if creds and creds.expired and creds.refresh_token:
+            self._logger.info("Refreshing expired credentials")
+            creds.refresh(self._get_auth_request())
+        else:
+            self._logger.info("Starting OAuth2 authorization flow")
+            flow = InstalledAppFlow.from_client_secrets_file(
+                self.config.credentials_path,
+                self.SCOPES,
+                redirect_uri="urn:ietf:wg:oauth:2.0:oob",  # Desktop app flow
+            )
+            creds = flow.run_local_server(port=0)
+            self._logger.info("Authorization completed")
+
+        # Save the credentials for the next run
+        with token_path.open("w") as token:
+            token.write(creds.to_json())
+            self._logger.info("Saved new credentials")
+
+        return creds
+
+    @classmethod
+    def _get_auth_request(cls) -> Request:
+        """Get the shared transport used for token refreshes."""
+        if cls._auth_request is None:
+            from google.auth.transport.requests import Request
+
+            cls._auth_request = Request()
+        return cls._auth_request
+
+    def _get_http(self) -> AuthorizedHttp:
+        """Get this thread's authorized transport, httplib2 is not thread-safe."""
+        http = getattr(self._thread_http, "http", None)
+        # Re-initializing the service may have loaded new credentials
+        if http is None or http.credentials is not self._credentials:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_http.http = http
+        return http
+
+    def _execute(self, request: HttpRequest) -> dict[str, Any]:
+        """Execute a request on the calling thread's transport."""
+        return request.execute(http=self._get_http())
+
     def _ensure_calendar_exists(self) -> None:
         """Ensure calendar exists, create if it doesn't."""
         if not self.service:
             raise ApplicationError(CalendarErrors.SERVICE_NOT_INITIALIZED)
+
+        if calendar_id := self._load_verified_calendar_id():
+            self._calendar_id = calendar_id
+            self._logger.debug("Using recently verified calendar")
+            return
+
         try:
             self.service.calendars().get(calendarId=self.calendar_id).execute()
             self._logger.info("Found existing calendar")
+            self._save_verified_calendar_id()
 
         except HttpError as error:
-            if error.resp.status == HTTPStatus.NOT_FOUND.value:
+            if error.resp.status == HTTP_NOT_FOUND:
                 self._logger.info("Calendar not found, creating new one")
 
                 # Create calendar
                 calendar_body = {
                     "summary": self.config.calendar_name,
-                    "timeZone": "Europe/Moscow",
+                    "timeZone": CALENDAR_TIMEZONE,
                 }
 
                 created_calendar = (
@@ -127,6 +240,7 @@ class GoogleCalendarService:
                 # Update calendar ID
                 self._calendar_id = created_calendar["id"]
                 self._logger.info("Created new calendar", calendar_id=self._calendar_id)
+                self._save_verified_calendar_id()
             else:
                 raise
         except Exception as e:
@@ -135,17 +249,48 @@ class GoogleCalendarService:
                 CalendarErrors.CALENDAR_SETUP_FAILED, original_error=e
             ) from e
 
+    @property
+    def _calendar_state_path(self) -> Path:
+        """Path of the file remembering the last verified calendar."""
+        return Path(self.config.token_path).with_suffix(".calendar.json")
+
+    def _load_verified_calendar_id(self) -> str | None:
+        """Get the calendar ID verified within the TTL for the configured calendar."""
+        try:
+            state = json.loads(self._calendar_state_path.read_text())
+            verified_at = datetime.fromisoformat(state["verified_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        ttl = timedelta(days=self.config.calendar_verify_ttl_days)
+        if state.get("configured_id") != self.config.calendar_id:
+            return None
+        if datetime.now(UTC) - verified_at > ttl:
+            return None
+        return state.get("id")
+
+    def _save_verified_calendar_id(self) -> None:
+        """Remember that the current calendar ID exists."""
+        state = {
+            "configured_id": self.config.calendar_id,
+            "id": self._calendar_id,
+            "verified_at": datetime.now(UTC).isoformat(),
+        }
+        try:
+            self._calendar_state_path.write_text(json.dumps(state))
+        except OSError as e:
+            self._logger.warning("Failed to save calendar state", error=str(e))
+
     async def create_event(self, event: ScheduleEvent) -> str:
         """Create a calendar event."""
         if not self.service:
             raise ApplicationError(CalendarErrors.SERVICE_NOT_INITIALIZED)
         try:
             event_body = self._create_event_body(event)
-            result = (
-                self.service.events()
-                .insert(calendarId=self.calendar_id, body=event_body)
-                .execute()
+            request = self.service.events().insert(
+                calendarId=self.calendar_id, body=event_body
             )
+            result = await asyncio.to_thread(self._execute, request)
 
             self._logger.info(
                 "Created calendar event", event_id=result["id"], subject=event.subject
@@ -161,24 +306,97 @@ class GoogleCalendarService:
             raise ApplicationError(error_message, original_error=e) from e
 
     async def create_events(self, events: list[ScheduleEvent]) -> list[str]:
-        """Create multiple calendar events."""
+        """
+        Create multiple calendar events.
+
+        Inserts are packed into batch requests of up to ``BATCH_SIZE`` calls,
+        so N events cost ceil(N / BATCH_SIZE) HTTP round-trips instead of N.
+        Batches run concurrently, at most ``config.max_concurrency`` at once.
+        """
         if not events:
             self._logger.warning("No events to create")
             return []
+        if not self.service:
+            raise ApplicationError(CalendarErrors.SERVICE_NOT_INITIALIZED)
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def insert_chunk(chunk: list[ScheduleEvent]) -> list[str]:
+            async with semaphore:
+                return await asyncio.to_thread(self._insert_batch, chunk)
+
+        chunks = [
+            events[start : start + self.BATCH_SIZE]
+            for start in range(0, len(events), self.BATCH_SIZE)
+        ]
+        # A failed batch must not abort the batches that are already in
+        results = await asyncio.gather(
+            *(insert_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
 
         event_ids = []
-        for event in events:
-            try:
-                event_id = await self.create_event(event)
-                event_ids.append(event_id)
-            except Exception as e:
-                self._logger.exception(
-                    "Failed to create event", subject=event.subject, error=str(e)
+        for batch_index, (chunk, result) in enumerate(
+            zip(chunks, results, strict=True)
+        ):
+            if isinstance(result, BaseException):
+                self._logger.error(
+                    "Failed to insert batch",
+                    batch=batch_index,
+                    event_count=len(chunk),
+                    error=str(result),
                 )
                 continue
-
+            event_ids.extend(result)
+        self._logger.info(
+            "Created calendar events",
+            requested=len(events),
+            created=len(event_ids),
+            batches=len(chunks),
+        )
         return event_ids
 
+    def _insert_batch(self, events: list[ScheduleEvent]) -> list[str]:
+        """Insert events with a single batch request, return created IDs."""
+        results: dict[int, str] = {}
+
+        def on_event_created(
+            request_id: str, response: dict[str, Any], exception: HttpError | None
+        ) -> None:
+            event = events[int(request_id)]
+            if exception is not None:
+                self._logger.error(
+                    "Failed to create event",
+                    subject=event.subject,
+                    error=str(exception),
+                )
+                return
+            results[int(request_id)] = response["id"]
+            self._logger.info(
+                "Created calendar event", event_id=response["id"], subject=event.subject
+            )
+
+        batch = self.service.new_batch_http_request(callback=on_event_created)
+        # Resolve the collection and bound methods once, not per event
+        insert = self.service.events().insert
+        add = batch.add
+        create_body = self._create_event_body
+        calendar_id = self.calendar_id
+        for index, event in enumerate(events):
+            add(
+                insert(calendarId=calendar_id, body=create_body(event)),
+                request_id=str(index),
+            )
+
+        try:
+            batch.execute(http=self._get_http())
+        except HttpError as e:
+            self._logger.exception(
+                "Failed to execute batch", event_count=len(events), error=str(e)
+            )
+            return []
+
+        return [results[index] for index in sorted(results)]
+
     def _create_event_body(self, event: ScheduleEvent) -> dict[str, Any]:
         """
         Create Google Calendar event body from ScheduleEvent.
@@ -203,65 +421,48 @@ class GoogleCalendarService:
             >>> assert "summary" in body
             >>> assert "location" in body
         """
+        lesson_type = event.lesson_type.value
+
         # Format event summary
-        summary = f"{event.subject} ({event.lesson_type.value})"
+        summary = f"{event.subject} ({lesson_type})"
         if event.subgroup:
             summary += f" - Подгруппа {event.subgroup}"
 
         # Format description with additional details
         description = (
             f"Преподаватель: {event.teacher}\n"
-            f"Тип занятия: {event.lesson_type.value}\n"
+            f"Тип занятия: {lesson_type}\n"
             f"Группа: {event.group}"
         )
 
         # Format location string
         location = str(event.location)
+        start = event.start_time.isoformat()
+        end = event.end_time.isoformat()
 
         # Create event body according to Google Calendar API spec
         # https://developers.google.com/calendar/api/v3/reference/events#resource
-        event_body = {
+        return {
             "summary": summary,
             "location": location,
             "description": description,
-            "start": {
-                "dateTime": event.start_time.isoformat(),
-                "timeZone": "Europe/Moscow",
-            },
-            "end": {
-                "dateTime": event.end_time.isoformat(),
-                "timeZone": "Europe/Moscow",
-            },
-            "reminders": {
-                "useDefault": False,
-                "overrides": [
-                    {"method": "popup", "minutes": 15},
-                ],
-            },
+            "start": {"dateTime": start, "timeZone": CALENDAR_TIMEZONE},
+            "end": {"dateTime": end, "timeZone": CALENDAR_TIMEZONE},
+            "reminders": EVENT_REMINDERS,
             # Add color based on lesson type
-            # https://developers.google.com/calendar/api/v3/reference/colors/get
             "colorId": self._get_event_color(event.lesson_type),
             # Add extended properties for better tracking
             "extendedProperties": {
                 "private": {
                     "teacher": event.teacher,
                     "group": event.group,
-                    "lessonType": event.lesson_type.value,
+                    "lessonType": lesson_type,
                     "subgroup": str(event.subgroup) if event.subgroup else "",
-                    "source": "mtuci_sync",
+                    "source": EVENT_SOURCE,
                 }
             },
         }
 
-        self._logger.debug(
-            "created_event_body",
-            summary=summary,
-            start=event.start_time.isoformat(),
-            end=event.end_time.isoformat(),
-        )
-
-        return event_body
-
     def _get_event_color(self, lesson_type: LessonType) -> str:
         """
         Get Google Calendar color ID for lesson type.
@@ -286,9 +487,4 @@ class GoogleCalendarService:
             10: Basil
             11: Tomato
         """
-        color_map = {
-            LessonType.LECTURE: "9",  # Blueberry
-            LessonType.PRACTICE: "10",  # Basil
-            LessonType.LAB: "7",  # Peacock
-        }
-        return color_map.get(lesson_type, "1")
+        return LESSON_TYPE_COLORS.get(lesson_type, DEFAULT_EVENT_COLOR)
@@ -0,0 +1,46 @@
+# src/scraping/_playwright_patch.py
+# ruff: noqa: SLF001
+"""
+Cheaper caller stack capture for the playwright async API.
+
+Every playwright API call walks the Python stack and reads the locals of
+each frame to attach caller frames to the protocol message. The frames only
+feed tracing, which the scraper never records, so keep just the API name
+used in error messages and skip the rest. Set ``PW_INSPECT_STACK`` to keep
+playwright's original behaviour.
+
+Only the frame walk is replaced: ``_send_message_to_server`` still runs
+``traceback.extract_stack(limit=10)`` for every protocol message. The patch
+relies on private playwright internals, so playwright is pinned to the
+version it was written against (1.63.0) in ``requirements.txt``.
+"""
+
+import os
+import sys
+
+from playwright._impl import _connection
+from playwright._impl import _impl_to_api_mapping
+
+
+def _capture_api_name() -> "_connection.ParsedStackTrace":
+    """Find the public API name of the current call without collecting frames."""
+    # Skip this helper and the wrap_api_call that invoked it
+    frame = sys._getframe(2)
+    last_internal_name = api_name = ""
+    while frame:
+        code = frame.f_code
+        if code.co_filename.startswith(_connection._PLAYWRIGHT_MODULE_PATH):
+            # The api/impl glue layer is not part of the public API
+            if code.co_filename != _impl_to_api_mapping.__file__:
+                last_internal_name = code.co_qualname
+        elif last_internal_name:
+            api_name = last_internal_name
+            last_internal_name = ""
+        frame = frame.f_back
+    return {"frames": [], "apiName": api_name or last_internal_name, "title": None}
+
+
+if not os.environ.get("PW_INSPECT_STACK") and hasattr(
+    _connection, "_capture_stack_trace"
+):
+    _connection._capture_stack_trace = _capture_api_name
@@ -1,5 +1,7 @@
 # src/scraping/auth.py
 import asyncio
+import time
+from urllib.parse import urlsplit
 
 import structlog
 from playwright.async_api import Error as PlaywrightError
@@ -8,10 +10,97 @@ from playwright.async_api import TimeoutError
 from pydantic import BaseModel
 from pydantic import EmailStr
 
+from src.core.circuit_breaker import get_circuit_breaker
 from src.core.exceptions import ApplicationError
+from src.scraping import _playwright_patch  # noqa: F401
 
 logger = structlog.get_logger(__name__)
 
+# Probe a list of selectors in one round-trip instead of one query per selector
+FIRST_MATCHING_SELECTOR_JS = """
+    (selectors) => selectors.find((s) => document.querySelector(s)) ?? null
+"""
+FIRST_MATCHING_TEXT_JS = """
+    (selectors) => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element) return element.textContent;
+        }
+        return null;
+    }
+"""
+# Defines the status toast helper, installed as an init script so every
+# later document has it and a status update only sends the message
+STATUS_HELPER_JS = """
+    window.__setAuthStatus = (message) => {
+        let status = document.getElementById('auth-status');
+        if (!status) {
+            status = document.createElement('div');
+            status.id = 'auth-status';
+            status.style.cssText = `
+                position: fixed;
+                top: 20px;
+                left: 20px;
+                background: rgba(0, 0, 0, 0.8);
+                color: white;
+                padding: 15px 20px;
+                border-radius: 5px;
+                z-index: 9999;
+                font-family: Arial, sans-serif;
+                font-size: 14px;
+                box-shadow: 0 2px 10px rgba(0,0,0,0.3);
+            `;
+            document.body.appendChild(status);
+        }
+        status.textContent = message;
+    };
+"""
+SHOW_STATUS_JS = """
+    (message) => {
+        if (!window.__setAuthStatus) return false;
+        window.__setAuthStatus(message);
+        return true;
+    }
+"""
+INSTALL_STATUS_JS = f"""
+    (message) => {{
+        {STATUS_HELPER_JS}
+        window.__setAuthStatus(message);
+    }}
+"""
+# Authenticated if the layout is shown, not if the login form is, otherwise
+# fall back to looking for the username in the header
+AUTH_STATE_JS = """
+    ([layoutSelectors, loginForm, username]) => {
+        const layout = layoutSelectors.find((s) => document.querySelector(s));
+        if (layout) return { authenticated: true, hit: layout };
+        if (document.querySelector(loginForm)) {
+            return { authenticated: false, hit: loginForm };
+        }
+        if (document.querySelector(username)) {
+            return { authenticated: true, hit: username };
+        }
+        return { authenticated: false, hit: null };
+    }
+"""
+# Fill both login fields in one round-trip, firing the events the form listens to
+FILL_CREDENTIALS_JS = """
+    ([username, password]) => {
+        const fields = [
+            [document.querySelector("#username"), username],
+            [document.querySelector("#password"), password],
+        ];
+        if (fields.some(([field]) => !field)) return false;
+        for (const [field, value] of fields) {
+            field.focus();
+            field.value = value;
+            field.dispatchEvent(new Event("input", { bubbles: true }));
+            field.dispatchEvent(new Event("change", { bubbles: true }));
+        }
+        return true;
+    }
+"""
+
 
 class AuthConfig(BaseModel):
     """Authentication configuration."""
@@ -19,6 +108,8 @@ class AuthConfig(BaseModel):
     email: EmailStr
     password: str
     login_url: str = "https://lk.mtuci.ru/auth/login"
+    # Cookies/localStorage of the last successful login, reused on the next run
+    storage_state_path: str = "mtuci_state.json"
 
 
 class AuthenticationError(Exception):
@@ -33,6 +124,10 @@ class AuthenticationError(Exception):
     LOGIN_FAILED = "Login failed: {}"
 
 
+class InvalidCredentialsError(AuthenticationError):
+    """Raised when MTUCI rejects the submitted credentials."""
+
+
 class AuthValidationError(Exception):
     """Raised when form validation fails."""
 
@@ -45,189 +140,162 @@ class AuthValidationError(Exception):
 class MTUCIAuthenticator:
     """Handle authentication to MTUCI personal account."""
 
+    # Login form elements
+    FORM_ELEMENTS = {
+        "username": "#username",
+        "password": "#password",
+        "submit": "#login-submit-button",
+    }
+    # Elements of the authenticated layout
+    LAYOUT_ELEMENTS = ["#side-menu", ".user-panel", "#main-menu"]
+    LOGIN_FORM = "#kc-form-login"
+    USERNAME_ELEMENT = ".user-panel h4"
+    # Login error message containers
+    ERROR_SELECTORS = [
+        ".alert-error",
+        ".alert-danger",
+        "#error-message",
+        ".kc-feedback-text",
+    ]
+    # Elements that indicate we're on the schedule page
+    SCHEDULE_INDICATORS = [
+        ".schedule-month",  # Month selector
+        ".button-day",  # Day buttons
+        ".schedule-lessons",  # Lessons container
+        "schedule-page",  # The component itself
+        "h4.current-day",  # Current day header
+        ".lessons-tabs",  # Tabs for different schedule views
+    ]
+    # Selector unions for waiting on any of several elements at once
+    SCHEDULE_SELECTOR_UNION = ", ".join(SCHEDULE_INDICATORS)
+    AUTH_RESULT_SELECTOR_UNION = ", ".join(LAYOUT_ELEMENTS + ERROR_SELECTORS)
+    LOGIN_PAGE_SELECTOR_UNION = ", ".join([LOGIN_FORM, *LAYOUT_ELEMENTS])
+    SCHEDULE_URL = "https://lk.mtuci.ru/student/schedule"
+    # Schedule navigation retries, later attempts wait for more of the page
+    SCHEDULE_NAV_RETRIES = 5
+    SCHEDULE_NAV_BASE_DELAY = 1  # seconds
+    SCHEDULE_NAV_MAX_DELAY = 8  # seconds
+    SCHEDULE_NAV_TIMEOUT_MS = 60_000
+    COMMIT_WAIT_TIMEOUT_MS = 15_000
+    # Attempts before switching to the "load" wait and the schedule link
+    DOM_WAIT_ATTEMPTS = 3
+    # How long to wait for the page to settle into a recognizable state
+    STATE_WAIT_TIMEOUT_MS = 5000
+    # How long a positive auth check is trusted for the same URL
+    AUTH_STATE_TTL = 5.0  # seconds
+
     def __init__(self, config: AuthConfig) -> None:
         """Initialize authenticator with config."""
         self.config = config
         self._logger = logger.bind(email=config.email)
+        # Page URL -> monotonic time it was last seen authenticated
+        self._authenticated_at: dict[str, float] = {}
 
     async def _show_status(self, page: Page, message: str) -> None:
         """Show status message on page."""
-        js_code = """
-            (message) => {
-                let status = document.getElementById('auth-status');
-                if (!status) {
-                    status = document.createElement('div');
-                    status.id = 'auth-status';
-                    status.style.cssText = `
-                        position: fixed;
-                        top: 20px;
-                        left: 20px;
-                        background: rgba(0, 0, 0, 0.8);
-                        color: white;
-                        padding: 15px 20px;
-                        border-radius: 5px;
-                        z-index: 9999;
-                        font-family: Arial, sans-serif;
-                        font-size: 14px;
-                        box-shadow: 0 2px 10px rgba(0,0,0,0.3);
-                    `;
-                    document.body.appendChild(status);
-                }
-                status.textContent = message;
-            }
-        """
-        await page.evaluate(js_code, message)
-
-    async def _check_login_form(self, page: Page) -> bool:
-        """Check if login form is present."""
-        login_form = await page.query_selector("#kc-form-login")
-        return bool(login_form)
-
-    async def _check_auth_elements(self, page: Page) -> bool:
-        """Check for authentication elements."""
-        auth_elements = [
-            "#username",
-            "#password",
-            "#login-submit-button",
-            "#kc-page-title",
-        ]
-        for selector in auth_elements:
-            if await page.query_selector(selector):
-                self._logger.debug("Auth element found", selector=selector)
-                return True
-        return False
-
-    async def _check_success_indicators(self, page: Page) -> bool:
-        """Check for successful authentication indicators."""
-        indicators = [
-            ".user-profile",
-            ".logout-button",
-            "#schedule-container",
-            ".student-info",
-        ]
-        for indicator in indicators:
-            if await page.query_selector(indicator):
-                self._logger.debug("Success indicator found", indicator=indicator)
-                return True
-        return False
-
-    async def _check_page_title(self, page: Page) -> bool:
-        """Check if page title indicates authentication."""
-        title = await page.title()
-        auth_titles = ["Личный кабинет", "Расписание", "Профиль"]
-        return any(x in title for x in auth_titles)
+        if not await page.evaluate(SHOW_STATUS_JS, message):
+            # The document predates the init script: define the helper here
+            # and in every document the page loads from now on
+            await page.evaluate(INSTALL_STATUS_JS, message)
+            await page.add_init_script(STATUS_HELPER_JS)
+
+    async def _find_first_selector(
+        self, page: Page, selectors: list[str]
+    ) -> str | None:
+        """Return the first selector matching an element on the page."""
+        return await page.evaluate(FIRST_MATCHING_SELECTOR_JS, selectors)
+
+    async def _wait_for_any(
+        self, page: Page, selector_union: str, timeout_ms: float | None = None
+    ) -> None:
+        """Wait until any of the selectors is attached, give up silently on timeout."""
+        if timeout_ms is None:
+            timeout_ms = self.STATE_WAIT_TIMEOUT_MS
+        try:
+            await page.wait_for_selector(
+                selector_union, state="attached", timeout=timeout_ms
+            )
+        except TimeoutError:
+            self._logger.debug("No expected element appeared", selector=selector_union)
 
     async def _check_auth_state(self, page: Page) -> bool:
         """Check if already authenticated."""
-        try:
-            # First check - look for the main layout elements
-            layout_elements = [
-                "#side-menu",
-                ".user-panel",
-                "#main-menu",
-            ]
-
-            for selector in layout_elements:
-                if await page.query_selector(selector):
-                    self._logger.info(
-                        "Found authenticated layout element", selector=selector
-                    )
-                    return True
-
-            # Second check - verify we're not on the login page
-            login_form = await page.query_selector("#kc-form-login")
-            if login_form:
-                self._logger.debug("Login form found, not authenticated")
-                return False
-
-            # Third check - look for the username in the header
-            try:
-                username_el = await page.query_selector(".user-panel h4")
-                if username_el:
-                    self._logger.info("Found username element")
-                    return True
-            except PlaywrightError as e:
-                self._logger.warning("Error checking auth state", error=str(e))
-                return False
-            else:
-                return False
+        # Only positive results are reused: a page that was not logged in may
+        # finish logging in at the same URL, but a logged in one stays so
+        seen_at = self._authenticated_at.get(page.url)
+        if seen_at is not None and time.monotonic() - seen_at < self.AUTH_STATE_TTL:
+            return True
 
+        try:
+            # All probes run in the page, in order, within one round-trip
+            state = await page.evaluate(
+                AUTH_STATE_JS,
+                [self.LAYOUT_ELEMENTS, self.LOGIN_FORM, self.USERNAME_ELEMENT],
+            )
         except PlaywrightError as e:
             self._logger.warning("Error checking auth state", error=str(e))
             return False
 
+        if state["authenticated"]:
+            self._logger.info("Found authenticated element", selector=state["hit"])
+            self._authenticated_at[page.url] = time.monotonic()
+        elif state["hit"]:
+            self._logger.debug("Login form found, not authenticated")
+        return state["authenticated"]
+
     async def navigate_to_schedule(self, page: Page) -> None:
         """Navigate to schedule page with retry logic."""
-        max_retries = 5  # Increased from 3 to 5
-        base_delay = 1  # seconds
-        max_timeout = 60000  # Increased from 30000 to 60000 (60 seconds)
-
+        max_retries = self.SCHEDULE_NAV_RETRIES
         for attempt in range(max_retries):
             try:
                 self._logger.info(
-                    f"Navigating to schedule page (attempt {attempt+1}/{max_retries})"
+                    "Navigating to schedule page",
+                    attempt=attempt + 1,
+                    max_retries=max_retries,
                 )
 
-                # Use progressively less strict wait conditions with each retry
-                if attempt < 2:
-                    wait_condition = "domcontentloaded"  # Fastest, least strict
-                    current_timeout = max_timeout
-                elif attempt < 4:
-                    wait_condition = (
-                        "load"  # Medium, waits for resources but not network idle
-                    )
-                    current_timeout = max_timeout
-                else:
-                    wait_condition = (
-                        "networkidle"  # Strictest, waits for network to be idle
-                    )
-                    current_timeout = max_timeout * 2
-
+                wait_condition, current_timeout, selector_timeout = (
+                    self._schedule_wait_plan(attempt)
+                )
                 self._logger.info(
-                    f"Using wait condition: {wait_condition} with timeout: {current_timeout}ms"
+                    "Using wait condition",
+                    wait_condition=wait_condition,
+                    timeout_ms=current_timeout,
                 )
 
                 # Navigate to schedule page
-                await page.goto(
-                    "https://lk.mtuci.ru/student/schedule",
-                    wait_until=wait_condition,
-                    timeout=current_timeout,
+                await self._goto(
+                    page, self.SCHEDULE_URL, wait_condition, current_timeout
                 )
 
-                # Add a small delay to allow for any dynamic content to load
-                await asyncio.sleep(1)
+                # Wait until any schedule element renders instead of a fixed delay
+                await self._wait_for_any(
+                    page, self.SCHEDULE_SELECTOR_UNION, timeout_ms=selector_timeout
+                )
 
-                # Check if we're actually on the schedule page
-                if await self._verify_schedule_page(page):
+                # Check if we're actually on the schedule page. Right after
+                # commit the URL always matches, only an element proves it
+                if await self._verify_schedule_page(
+                    page, url_fallback=wait_condition != "commit"
+                ):
                     self._logger.info("Successfully navigated to schedule page")
                     return
                 # Try a direct approach if verification fails
-                if attempt >= 3:
-                    self._logger.info("Trying direct element interaction approach")
-                    try:
-                        # Try clicking on schedule link if available
-                        schedule_link = await page.query_selector(
-                            "a[href='/student/schedule']"
-                        )
-                        if schedule_link:
-                            await schedule_link.click()
-                            await asyncio.sleep(2)
-                            if await self._verify_schedule_page(page):
-                                self._logger.info(
-                                    "Successfully navigated to schedule page via link click"
-                                )
-                                return
-                    except PlaywrightError as e:
-                        self._logger.warning(f"Direct interaction failed: {e!s}")
+                if attempt >= self.DOM_WAIT_ATTEMPTS and (
+                    await self._open_schedule_via_link(page)
+                ):
+                    return
 
                 self._logger.warning(
-                    f"Schedule page verification failed (attempt {attempt+1})"
+                    "Schedule page verification failed", attempt=attempt + 1
                 )
 
             except PlaywrightError as e:
                 # Log the error and retry
                 self._logger.warning(
-                    f"Error navigating to schedule page (attempt {attempt+1}/{max_retries})",
+                    "Error navigating to schedule page",
+                    attempt=attempt + 1,
+                    max_retries=max_retries,
                     error=str(e),
                 )
 
@@ -238,37 +306,95 @@ class MTUCIAuthenticator:
                     )
                     raise
 
-            # Exponential backoff: wait longer with each retry
-            delay = base_delay * (2**attempt)
-            self._logger.info(f"Retrying in {delay} seconds...")
-            await asyncio.sleep(delay)
+            if attempt < max_retries - 1:
+                # Exponential backoff: wait longer with each retry, up to a cap
+                delay = min(
+                    self.SCHEDULE_NAV_BASE_DELAY * (2**attempt),
+                    self.SCHEDULE_NAV_MAX_DELAY,
+                )
+                self._logger.info("Retrying", delay=delay)
+                await asyncio.sleep(delay)
 
         # If we've exhausted retries, raise an error
         raise AuthenticationError(AuthenticationError.AUTH_TIMEOUT)
 
-    async def _verify_schedule_page(self, page: Page) -> bool:
+    def _schedule_wait_plan(self, attempt: int) -> tuple[str, int, int]:
+        """
+        Pick how a schedule navigation attempt waits for the page.
+
+        Later attempts use progressively stricter wait conditions.
+
+        Returns:
+            Wait condition, navigation timeout and selector timeout in ms
+        """
+        if attempt == 0:
+            # Return as soon as the response starts, then let the
+            # selector wait decide when the page is usable
+            return "commit", self.COMMIT_WAIT_TIMEOUT_MS, self.COMMIT_WAIT_TIMEOUT_MS
+        if attempt < self.DOM_WAIT_ATTEMPTS:
+            return (
+                "domcontentloaded",
+                self.SCHEDULE_NAV_TIMEOUT_MS,
+                self.STATE_WAIT_TIMEOUT_MS,
+            )
+        # Also wait for resources, but not for networkidle: trackers
+        # can keep the network busy after the schedule renders
+        if attempt == self.SCHEDULE_NAV_RETRIES - 1:
+            return "load", self.SCHEDULE_NAV_TIMEOUT_MS, self.SCHEDULE_NAV_TIMEOUT_MS
+        return "load", self.SCHEDULE_NAV_TIMEOUT_MS, self.STATE_WAIT_TIMEOUT_MS
+
+    async def _open_schedule_via_link(self, page: Page) -> bool:
+        """Click the schedule link, return whether the schedule page opened."""
+        self._logger.info("Trying direct element interaction approach")
+        try:
+            schedule_link = await page.query_selector("a[href='/student/schedule']")
+            if schedule_link is None:
+                return False
+            await schedule_link.click()
+            await asyncio.sleep(2)
+            opened = await self._verify_schedule_page(page)
+        except PlaywrightError as e:
+            self._logger.warning("Direct interaction failed", error=str(e))
+            return False
+
+        if opened:
+            self._logger.info("Successfully navigated to schedule page via link click")
+        return opened
+
+    async def _goto(
+        self, page: Page, url: str, wait_until: str, timeout_ms: float | None = None
+    ) -> None:
+        """
+        Open a page through the circuit breaker of its host.
+
+        Raises:
+            CircuitOpenError: If navigation to the host kept failing recently
+        """
+        # Shared per host, so once MTUCI is down later calls fail immediately
+        breaker = get_circuit_breaker(urlsplit(url).netloc)
+        breaker.check()
+        try:
+            await page.goto(url, wait_until=wait_until, timeout=timeout_ms)
+        except PlaywrightError:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+
+    async def _verify_schedule_page(
+        self, page: Page, *, url_fallback: bool = True
+    ) -> bool:
         """Verify that we're on the schedule page."""
         try:
-            # Look for elements that indicate we're on the schedule page
-            schedule_indicators = [
-                ".schedule-month",  # Month selector
-                ".button-day",  # Day buttons
-                ".schedule-lessons",  # Lessons container
-                "schedule-page",  # The component itself
-                "h4.current-day",  # Current day header
-                ".lessons-tabs",  # Tabs for different schedule views
-            ]
-
-            for selector in schedule_indicators:
-                element = await page.query_selector(selector)
-                if element:
-                    self._logger.debug(f"Found schedule indicator: {selector}")
-                    return True
+            if selector := await self._find_first_selector(
+                page, self.SCHEDULE_INDICATORS
+            ):
+                self._logger.debug("Found schedule indicator", selector=selector)
+                return True
 
             # Check URL as a fallback
             current_url = page.url
-            if "schedule" in current_url:
-                self._logger.debug(f"URL contains 'schedule': {current_url}")
+            if url_fallback and "schedule" in current_url:
+                self._logger.debug("URL contains 'schedule'", url=current_url)
                 return True
 
             # If we reach here, we didn't find any of the indicators
@@ -313,7 +439,8 @@ class MTUCIAuthenticator:
         self, template: str, *args: str, error: Exception | None = None
     ) -> None:
         """Raise authentication error with formatted message."""
-        message = template.format(*args)
+        # Constant messages have no placeholders, only format templates
+        message = template.format(*args) if args else template
         if error is not None:
             raise AuthenticationError(message) from error
         raise AuthenticationError(message)
@@ -329,65 +456,82 @@ class MTUCIAuthenticator:
         """Fill form field with retry logic."""
         for attempt in range(max_retries):
             try:
-                field = await page.query_selector(selector)
-                if field:
-                    await field.click()
-                    await page.keyboard.press("Control+A")
-                    await page.keyboard.press("Backspace")
-                    await field.fill(value)
-                    return
+                # fill() waits for the field and replaces its value in one call
+                await page.locator(selector).fill(value, timeout=5000)
+                return
             except PlaywrightError as e:
                 if attempt == max_retries - 1:
                     self._raise_validation_error(field_name, e)
                 await asyncio.sleep(1)
 
+    async def _fill_credentials(self, page: Page) -> None:
+        """Fill username and password, falling back to per-field filling."""
+        try:
+            if await page.evaluate(
+                FILL_CREDENTIALS_JS, [self.config.email, self.config.password]
+            ):
+                return
+        except PlaywrightError as e:
+            self._logger.warning("Failed to fill credentials at once", error=str(e))
+
+        await self._fill_form_field(page, "#username", self.config.email, "username")
+        await self._fill_form_field(page, "#password", self.config.password, "password")
+
     async def _verify_form_elements(self, page: Page) -> None:
         """Verify all form elements are present."""
-        form_elements = {
-            "username": "#username",
-            "password": "#password",
-            "submit": "#login-submit-button",
-        }
-
-        for name, selector in form_elements.items():
-            try:
-                await page.wait_for_selector(selector, state="visible", timeout=10_000)
-            except TimeoutError as e:
+        # Wait for all elements concurrently, sharing one timeout budget
+        results = await asyncio.gather(
+            *(
+                page.wait_for_selector(selector, state="visible", timeout=10_000)
+                for selector in self.FORM_ELEMENTS.values()
+            ),
+            return_exceptions=True,
+        )
+        for name, result in zip(self.FORM_ELEMENTS, results, strict=True):
+            if isinstance(result, TimeoutError):
                 self._raise_auth_error(
-                    AuthenticationError.FORM_ELEMENT_NOT_FOUND, name, error=e
+                    AuthenticationError.FORM_ELEMENT_NOT_FOUND, name, error=result
                 )
+            if isinstance(result, BaseException):
+                raise result
 
     async def _check_error_messages(self, page: Page) -> str | None:
         """Check for error messages after login attempt."""
-        error_selectors = [
-            ".alert-error",
-            ".alert-danger",
-            "#error-message",
-            ".kc-feedback-text",
-        ]
-
-        for selector in error_selectors:
-            error_el = await page.query_selector(selector)
-            if error_el:
-                return await error_el.text_content()
-        return None
+        return await page.evaluate(FIRST_MATCHING_TEXT_JS, self.ERROR_SELECTORS)
 
     async def _handle_form_submission(self, page: Page) -> None:
         """Handle form submission and validation."""
-        submit_button = await page.query_selector("#login-submit-button")
-        if not submit_button:
-            self._raise_auth_error(AuthenticationError.SUBMIT_BUTTON_NOT_FOUND)
-
-        await submit_button.click()
+        # The locator waits for the button itself, no separate lookup needed
+        try:
+            await page.locator(self.FORM_ELEMENTS["submit"]).click(timeout=5000)
+        except TimeoutError as e:
+            self._raise_auth_error(AuthenticationError.SUBMIT_BUTTON_NOT_FOUND, error=e)
 
     async def _validate_auth_result(self, page: Page) -> None:
         """Validate authentication result."""
+        # After a successful post-login navigation the layout is usually there
+        if await self._check_auth_state(page):
+            return
+
+        # Otherwise wait for either the authenticated layout or a login error,
+        # whichever shows up first, instead of sleeping a fixed time
+        await self._wait_for_any(page, self.AUTH_RESULT_SELECTOR_UNION)
+        if await self._check_auth_state(page):
+            return
+
+        # Error banners are only looked up when the login did not go through
         if error_msg := await self._check_error_messages(page):
-            self._raise_auth_error(AuthenticationError.LOGIN_FAILED, error_msg)
+            message = AuthenticationError.LOGIN_FAILED.format(error_msg)
+            raise InvalidCredentialsError(message)
+        self._raise_auth_error(AuthenticationError.FAILED_AUTH_STATE)
 
-        await asyncio.sleep(2)
-        if not await self._check_auth_state(page):
-            self._raise_auth_error(AuthenticationError.FAILED_AUTH_STATE)
+    async def _save_session(self, page: Page) -> None:
+        """Persist session cookies so the next run can skip the login form."""
+        try:
+            await page.context.storage_state(path=self.config.storage_state_path)
+            self._logger.debug("Saved session state")
+        except (PlaywrightError, OSError) as e:
+            self._logger.warning("Failed to save session state", error=str(e))
 
     async def authenticate(self, page: Page) -> None:
         """
@@ -409,17 +553,19 @@ class MTUCIAuthenticator:
             await self._show_status(page, "Начинаем процесс авторизации...")
 
             # Navigate and verify form
-            await page.goto(self.config.login_url)
-            await page.wait_for_load_state("networkidle")
+            # Don't wait for network idle, the form or layout showing up is enough
+            await self._goto(page, self.config.login_url, "domcontentloaded")
+            await self._wait_for_any(page, self.LOGIN_PAGE_SELECTOR_UNION)
+
+            # A session restored from storage state redirects past the form
+            if await self._check_auth_state(page):
+                self._logger.info("Authenticated with saved session")
+                return
+
             await self._verify_form_elements(page)
 
             # Fill form
-            await self._fill_form_field(
-                page, "#username", self.config.email, "username"
-            )
-            await self._fill_form_field(
-                page, "#password", self.config.password, "password"
-            )
+            await self._fill_credentials(page)
 
             # Submit and validate
             async with page.expect_navigation(timeout=20_000) as navigation:
@@ -431,12 +577,14 @@ class MTUCIAuthenticator:
             await self._show_status(page, "Авторизация успешна!")
             self._logger.info("Authentication successful")
 
+            await self._save_session(page)
+
         except TimeoutError as e:
             self._logger.exception("Authentication timeout")
             await self._show_status(page, "Ошибка: превышено время ожидания")
             self._raise_auth_error(AuthenticationError.AUTH_TIMEOUT, error=e)
 
-        except AuthValidationError:
+        except (AuthValidationError, InvalidCredentialsError):
             raise
 
         except Exception as e:
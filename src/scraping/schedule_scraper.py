@@ -1,75 +1,285 @@
 # src/scraping/schedule_scraper.py
 
 import asyncio
+import random
+import re
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import suppress
 from datetime import UTC
 from datetime import datetime
 from datetime import time
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING
+from typing import Any
 
 import structlog
+from playwright.async_api import CDPSession
 from playwright.async_api import Error as PlaywrightError
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from src.core.circuit_breaker import CircuitOpenError
 from src.core.exceptions import ApplicationError
 from src.models.schedule import LessonType
 from src.models.schedule import Location
 from src.models.schedule import ScheduleEvent
+from src.scraping import _playwright_patch  # noqa: F401
 from src.scraping.auth import AuthConfig
+from src.scraping.auth import AuthenticationError
+from src.scraping.auth import AuthValidationError
+from src.scraping.auth import InvalidCredentialsError
 from src.scraping.auth import MTUCIAuthenticator
 
+if TYPE_CHECKING:
+    from src.core.chaos import FaultInjector
+
 logger = structlog.get_logger(__name__)
 
+# Extracts the raw texts of every lesson on the page: the subject header and
+# the teacher/type and time/location spans of the first two info rows
+LESSONS_JS = """
+() => Array.from(document.querySelectorAll(".lesson"), (lesson) => {
+    const text = (el) => (el ? el.textContent : null);
+    const info = lesson.querySelector("div.lesson-info")
+        || lesson.querySelector("div.text-gray");
+    let rows = info ? info.querySelectorAll(".d-flex.flex-wrap") : [];
+    if (info && rows.length < 2) rows = info.querySelectorAll("div");
+    const spans = (row) => (row ? row.querySelectorAll("span") : []);
+    const [teacher, type] = spans(rows[0]);
+    const [time, location] = spans(rows[1]);
+    return {
+        subject: text(lesson.querySelector("h4")),
+        containers: rows.length,
+        teacher: text(teacher),
+        type: text(type),
+        time: text(time),
+        location: text(location),
+    };
+})
+"""
+DAY_BUTTON_TEXTS_JS = """
+() => Array.from(document.querySelectorAll(".button-day"), (b) => b.textContent)
+"""
+
+# True once the day header ("Среда, 13 ноября 2024 г.") shows the given
+# "13 ноября", i.e. the clicked day has rendered
+CURRENT_DAY_SHOWS_JS = """
+(expected) => {
+    const header = document.querySelector("h4.current-day");
+    const date = header?.textContent.split(",")[1]?.trim().toLowerCase() ?? "";
+    return date.startsWith(`${expected} `);
+}
+"""
+
+# Month names in the genitive case, as in "13 ноября 2024"
+RU_MONTHS = {
+    "января": 1,
+    "февраля": 2,
+    "марта": 3,
+    "апреля": 4,
+    "мая": 5,
+    "июня": 6,
+    "июля": 7,
+    "августа": 8,
+    "сентября": 9,
+    "октября": 10,
+    "ноября": 11,
+    "декабря": 12,
+}
+RU_MONTH_NAMES = {number: name for name, number in RU_MONTHS.items()}
+LESSON_TYPES = {
+    "Лекция": LessonType.LECTURE,
+    "Практическое занятие": LessonType.PRACTICE,
+    "Практика": LessonType.PRACTICE,
+    "Лабораторная работа": LessonType.LAB,
+    "Лабораторная": LessonType.LAB,
+}
+
+# "9:30 - 11:05" with any dash as separator, seconds are ignored
+TIME_RANGE_RE = re.compile(
+    r"(\d{1,2}):(\d{2})(?::\d{2})?\s*[-–—]\s*(\d{1,2}):(\d{2})(?::\d{2})?"
+)
+DEFAULT_TIME_RANGE = (time(9, 0), time(10, 30))
+
+# "Аудитория:", "Аудитория", "Ауд." or "Ауд:" before the room itself
+LOCATION_PREFIX_RE = re.compile(r"^(?:Аудитория:?|Ауд[.:])\s*")
+ONLINE_ROOMS = frozenset({"онлайн", "online"})
+BUILDINGS = frozenset({"Н", "А"})
+ONLINE_LOCATION = Location(building="Online", room="Online")
+GYM_LOCATION = Location(building="Н", room="Спортивный зал")
+
+_by_start_time = attrgetter("start_time")
+
+# Supplies events when the schedule cannot be scraped, e.g. a cached copy
+ScheduleFallback = Callable[[], Awaitable[list[ScheduleEvent]]]
+
 
 class ScrapingError(ApplicationError):
     """Base exception for scraping errors."""
 
 
+# Rooms repeat across days and Location is immutable, so instances are shared
+@lru_cache(maxsize=256)
+def parse_location(location_text: str) -> Location:
+    """Parse location from text."""
+    # Clean up the text and remove the prefix if present
+    location_text = LOCATION_PREFIX_RE.sub("", location_text.strip(), count=1)
+
+    # Handle special cases
+    location_lower = location_text.lower()
+    if location_lower in ONLINE_ROOMS:
+        return ONLINE_LOCATION
+
+    if "зал" in location_lower:
+        return Location(building="Н", room=location_text)
+
+    if "спортивный" in location_lower:
+        return GYM_LOCATION
+
+    # Try to parse building and room
+    # Common format is "Н-123" or "А-123"
+    building, separator, room = location_text.partition("-")
+    if separator:
+        building = building.strip()
+        room = room.strip()
+
+        # Validate building
+        if building not in BUILDINGS:
+            building = "Н"  # Default to Н
+
+        return Location(building=building, room=room)
+    # If no building specified, assume it's in the default building
+    return Location(building="Н", room=location_text)
+
+
+@lru_cache(maxsize=256)
+def match_time_range(time_text: str) -> tuple[time, time] | None:
+    """Parse a well-formed "HH:MM - HH:MM" range, or return None."""
+    match = TIME_RANGE_RE.fullmatch(time_text.strip())
+    if not match:
+        return None
+    start_h, start_m, end_h, end_m = map(int, match.groups())
+    try:
+        start_time, end_time = time(start_h, start_m), time(end_h, end_m)
+    except ValueError:
+        return None
+    return (start_time, end_time) if start_time < end_time else None
+
+
 class ScheduleParser:
     """Parser for MTUCI schedule page."""
 
-    MIN_TIME_LOCATION_SPANS = 2
-    MIN_TEACHER_TYPE_SPANS = 2
     MIN_FLEX_CONTAINERS = 2
     EXPECTED_DATE_PARTS = 2
+    # Day buttons re-render in place, the day header wait decides instead
+    CLICK_LOAD_TIMEOUT_MS = 2000
+    DAY_RENDER_TIMEOUT_MS = 10000
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, fault_injector: "FaultInjector | None" = None):
         self.page = page
+        self.fault_injector = fault_injector
         self._logger = logger.bind(component="ScheduleParser")
+        # Day button texts per page URL, dropped whenever a button is clicked
+        self._button_texts: dict[str, list[str | None]] = {}
+        # Date from the page header, dropped whenever a button is clicked
+        self._current_date: datetime | None = None
+        # Opened on first use, None afterwards means the browser has no CDP
+        self._cdp: CDPSession | None = None
+        self._cdp_supported = True
+
+    async def _evaluate_value(self, function: str) -> Any:
+        """
+        Call a no-argument page function and return its JSON result.
+
+        The extraction scripts take no arguments and return plain data, so on
+        Chromium they go straight to ``Runtime.evaluate`` and skip the argument
+        and handle marshalling of ``page.evaluate``.
+        """
+        if self._cdp is None and self._cdp_supported:
+            try:
+                self._cdp = await self.page.context.new_cdp_session(self.page)
+            except PlaywrightError:
+                self._cdp_supported = False
+        if self._cdp is None:
+            return await self.page.evaluate(function)
+
+        result = await self._cdp.send(
+            "Runtime.evaluate",
+            {"expression": f"({function})()", "returnByValue": True},
+        )
+        if details := result.get("exceptionDetails"):
+            # "text" is only "Uncaught", the thrown error is in "exception"
+            description = details.get("exception", {}).get("description")
+            error_message = f"Page script failed: {description or details.get('text')}"
+            self._raise_parsing_error(error_message)
+        return result["result"].get("value")
+
+    async def close(self) -> None:
+        """Detach the CDP session, if one was opened."""
+        if self._cdp is None:
+            return
+        cdp, self._cdp = self._cdp, None
+        # The page may already be closed, which detaches the session anyway
+        with suppress(PlaywrightError):
+            await cdp.detach()
+
+    async def _get_button_texts(self) -> list[str | None]:
+        """Get the texts of the day buttons, reading them in one round-trip."""
+        texts = self._button_texts.get(self.page.url)
+        if texts is None:
+            texts = await self._evaluate_value(DAY_BUTTON_TEXTS_JS)
+            self._button_texts[self.page.url] = texts
+        return texts
+
+    async def _get_button_date(self, date_text: str, year: int) -> datetime:
+        """Get the date shown on a day button."""
+        if "Сегодня" in date_text:
+            return await self._get_current_date()
+        # Parse date like "Чт 07.11"
+        day, month = date_text.split()[1].split(".")
+        return datetime(year, int(month), int(day), tzinfo=UTC)
 
     async def get_available_dates(self) -> list[datetime]:
         """Get list of available dates from the schedule."""
+        return [date for date, _ in await self.get_date_buttons()]
+
+    async def get_date_buttons(self) -> list[tuple[datetime, int]]:
+        """
+        Get available dates with the index of their day button.
+
+        Passing the index on to ``parse_day`` lets it click the button
+        directly instead of matching every button text again.
+        """
         try:
-            date_buttons = await self.page.query_selector_all(".button-day")
-            dates = []
+            year = datetime.now(UTC).year
+            buttons = []
 
-            for button in date_buttons:
-                date_text = await button.text_content()
+            for index, date_text in enumerate(await self._get_button_texts()):
                 if not date_text:
                     continue
 
                 try:
-                    if "Сегодня" in date_text:
-                        date = await self._get_current_date()
-                    else:
-                        # Parse date like "07.11"
-                        date_part = date_text.split()[1]
-                        day, month = date_part.split(".")
-                        date = datetime(
-                            datetime.now(UTC).year, int(month), int(day), tzinfo=UTC
-                        )
-                    dates.append(date)
+                    date = await self._get_button_date(date_text, year)
                 except (ValueError, IndexError) as e:
                     self._logger.warning(
                         "Failed to parse date button", text=date_text, error=str(e)
                     )
                     continue
+                buttons.append((date, index))
 
-            return sorted(dates)
+            return sorted(buttons)
         except Exception as e:
             error_message = "Failed to get available dates"
             raise ScrapingError(error_message) from e
 
     async def _get_current_date(self) -> datetime:
         """Get current date from page header."""
+        if self._current_date is not None:
+            return self._current_date
+
         try:
             header = await self.page.query_selector("h4.current-day")
             if not header:
@@ -88,153 +298,142 @@ class ScheduleParser:
                 self._raise_parsing_error(error_message)
 
             date_str = parts[1].strip()
-            # Convert month name to number
-            ru_months = {
-                "января": 1,
-                "февраля": 2,
-                "марта": 3,
-                "апреля": 4,
-                "мая": 5,
-                "июня": 6,
-                "июля": 7,
-                "августа": 8,
-                "сентября": 9,
-                "октября": 10,
-                "ноября": 11,
-                "декабря": 12,
-            }
-
             # Split date parts and clean up
             date_parts = date_str.split()
             day = int(date_parts[0])
-            month = ru_months[date_parts[1].lower()]
+            month = RU_MONTHS[date_parts[1].lower()]
             year = int(date_parts[2])
 
-            return datetime(year, month, day, tzinfo=UTC)
+            self._current_date = datetime(year, month, day, tzinfo=UTC)
 
         except Exception as e:
             error_message = f"Failed to parse current date: {e}"
             raise ScrapingError(error_message) from e
 
-    async def navigate_to_date(self, target_date: datetime) -> None:
+        return self._current_date
+
+    async def navigate_to_date(
+        self, target_date: datetime, button_index: int | None = None
+    ) -> None:
         """Navigate to specific date in schedule."""
         try:
-            # Add a small delay to ensure the page is ready
-            await asyncio.sleep(1)
+            if self.fault_injector:
+                await self.fault_injector.maybe_inject("navigate_to_date")
 
-            date_buttons = await self.page.query_selector_all(".button-day")
-            self._logger.debug(f"Found {len(date_buttons)} date buttons")
+            if button_index is None:
+                button_index = await self._find_date_button(target_date)
 
-            for button in date_buttons:
-                try:
-                    date_text = await button.text_content()
-                    if not date_text:
-                        continue
-
-                    self._logger.debug(f"Checking date button: {date_text}")
-
-                    if "Сегодня" in date_text:
-                        current_date = await self._get_current_date()
-                        self._logger.debug(
-                            f"Current date is {current_date.date()}, target is {target_date.date()}"
-                        )
-                        if current_date.date() == target_date.date():
-                            await button.click()
-                            # Use a less strict wait condition with timeout
-                            try:
-                                await self.page.wait_for_load_state(
-                                    "load", timeout=30000
-                                )
-                            except Exception as e:
-                                self._logger.warning(
-                                    f"Wait for load state failed after clicking today button: {e!s}"
-                                )
-                            return
-                    else:
-                        # Parse button date
-                        try:
-                            # Handle different date formats
-                            parts = date_text.split()
-                            if len(parts) >= 2:
-                                date_part = parts[1]
-                                if "." in date_part:
-                                    day, month = map(int, date_part.split("."))
-                                    button_date = datetime(
-                                        target_date.year, month, day, tzinfo=UTC
-                                    )
-
-                                    self._logger.debug(
-                                        f"Button date is {button_date.date()}, target is {target_date.date()}"
-                                    )
-
-                                    if button_date.date() == target_date.date():
-                                        await button.click()
-                                        # Use a less strict wait condition with timeout
-                                        try:
-                                            await self.page.wait_for_load_state(
-                                                "load", timeout=30000
-                                            )
-                                        except Exception as e:
-                                            self._logger.warning(
-                                                f"Wait for load state failed after clicking date button: {e!s}"
-                                            )
-                                        return
-                        except Exception as e:
-                            self._logger.warning(
-                                f"Failed to parse date from button text: {date_text}, error: {e!s}"
-                            )
-                            continue
-                except Exception as e:
-                    self._logger.warning(f"Error processing date button: {e!s}")
-                    continue
+            if button_index is not None:
+                await self._click_date_button(button_index, target_date)
+                return
 
             # Take a screenshot for debugging
             try:
                 screenshot_path = f"debug_screenshot_{target_date.date()}.png"
                 await self.page.screenshot(path=screenshot_path)
-                self._logger.info(f"Saved debug screenshot to {screenshot_path}")
-            except Exception as e:
-                self._logger.warning(f"Failed to take debug screenshot: {e!s}")
+                self._logger.info("Saved debug screenshot", path=screenshot_path)
+            except (PlaywrightError, OSError) as e:
+                self._logger.warning("Failed to take debug screenshot", error=str(e))
 
             error_message = f"Date {target_date.date()} not found in available dates"
             self._raise_parsing_error(error_message)
 
+        except PlaywrightError:
+            # The page itself is broken, not just this date
+            raise
         except Exception as e:
             error_message = f"Failed to navigate to date {target_date.date()}"
             self._logger.exception(error_message, error=str(e))
             raise ScrapingError(error_message) from e
 
-    async def parse_day(self, date: datetime) -> list[ScheduleEvent]:
-        """Parse schedule for specific date."""
-        try:
-            await self.navigate_to_date(date)
+    async def _find_date_button(self, target_date: datetime) -> int | None:
+        """Find the index of the day button showing the target date."""
+        button_texts = await self._get_button_texts()
+        self._logger.debug("Found date buttons", count=len(button_texts))
 
-            # Add a small delay to ensure the page has updated
-            await asyncio.sleep(2)
+        for index, date_text in enumerate(button_texts):
+            if not date_text:
+                continue
 
-            # Try to find lessons with a more generous timeout
+            self._logger.debug("Checking date button", date_text=date_text)
             try:
-                await self.page.wait_for_selector(".lesson", timeout=10000)
-            except Exception as e:
-                self._logger.warning(f"Wait for lessons failed: {e!s}")
+                button_date = await self._get_button_date(date_text, target_date.year)
+            except (ScrapingError, ValueError, IndexError) as e:
+                self._logger.warning(
+                    "Failed to parse date button", text=date_text, error=str(e)
+                )
+                continue
+
+            if button_date.date() == target_date.date():
+                return index
+
+        return None
+
+    async def _click_date_button(self, index: int, target_date: datetime) -> None:
+        """Click the day button at the given index and wait for that day."""
+        # Only the clicked button needs an element handle
+        self._button_texts.pop(self.page.url, None)
+        self._current_date = None
+        await self.page.locator(".button-day").nth(index).click()
+        # Use a less strict wait condition with timeout
+        try:
+            await self.page.wait_for_load_state(
+                "load", timeout=self.CLICK_LOAD_TIMEOUT_MS
+            )
+        except PlaywrightError as e:
+            self._logger.warning(
+                "Wait for load state failed after clicking date button",
+                error=str(e),
+            )
+        # Lessons read before the header shows the target date would belong
+        # to the previously shown day
+        expected = f"{target_date.day} {RU_MONTH_NAMES[target_date.month]}"
+        try:
+            await self.page.wait_for_function(
+                CURRENT_DAY_SHOWS_JS, arg=expected, timeout=self.DAY_RENDER_TIMEOUT_MS
+            )
+        except PlaywrightTimeoutError as e:
+            error_message = f"Day {target_date.date()} did not render"
+            raise ScrapingError(error_message) from e
+
+    async def parse_day(
+        self, date: datetime, button_index: int | None = None
+    ) -> list[ScheduleEvent]:
+        """
+        Parse schedule for specific date.
 
-            lessons = await self.page.query_selector_all(".lesson")
-            self._logger.info(f"Found {len(lessons)} lessons for {date.date()}")
+        Raises:
+            ScrapingError: If the day cannot be shown or read on this page
+            PlaywrightError: If the page itself fails, e.g. it was closed
+        """
+        try:
+            # Returns once the header shows the day, so its lessons are
+            # there to read; waiting for ".lesson" would stall on free days
+            await self.navigate_to_date(date, button_index)
+
+            # Read every lesson in one round-trip, parsing happens in Python
+            lessons = await self._evaluate_value(LESSONS_JS)
+            # Bind once instead of rebuilding the context for every lesson
+            day_logger = self._logger.bind(date=date.date())
+            day_logger.info("Found lessons", count=len(lessons))
 
             events = []
 
             for lesson in lessons:
                 try:
-                    event = await self._parse_lesson(lesson, date)
+                    event = self._parse_lesson(lesson, date)
                     events.append(event)
-                    self._logger.debug(f"Successfully parsed lesson: {event.subject}")
-                except Exception as e:
-                    self._logger.warning(
-                        "Failed to parse lesson", date=date.date(), error=str(e)
+                    day_logger.debug(
+                        "Successfully parsed lesson", subject=event.subject
                     )
+                except ScrapingError as e:
+                    day_logger.warning("Failed to parse lesson", error=str(e))
                     continue
 
             return events
+        except PlaywrightError:
+            # Left to the caller, another page or attempt may still get the day
+            raise
         except Exception as e:
             error_message = f"Failed to parse day {date.date()}"
             self._logger.exception(error_message, error=str(e))
@@ -244,252 +443,54 @@ class ScheduleParser:
         """Helper method to raise scraping errors."""
         raise ScrapingError(message)
 
-    async def _parse_lesson(self, lesson_el, base_date: datetime) -> ScheduleEvent:
-        """Parse single lesson element."""
-        try:
-            # Take a screenshot of the lesson element for debugging
-            try:
-                await lesson_el.screenshot(path=f"lesson_debug_{base_date.date()}.png")
-            except Exception as e:
-                self._logger.debug(f"Failed to take lesson screenshot: {e!s}")
-
-            # Get HTML content for debugging
-            try:
-                html_content = await lesson_el.evaluate("el => el.outerHTML")
-                self._logger.debug(f"Lesson HTML: {html_content}")
-            except Exception as e:
-                self._logger.debug(f"Failed to get lesson HTML: {e!s}")
-
-            # Get subject
-            subject_el = await lesson_el.query_selector("h4")
-            if not subject_el:
-                error_message = "Subject element not found"
-                self._logger.warning(error_message)
-                self._raise_parsing_error(error_message)
-            subject = await subject_el.text_content() or "Неизвестный предмет"
-
-            # Get info div
-            info_div = await lesson_el.query_selector(
-                "div.lesson-info"
-            ) or await lesson_el.query_selector("div.text-gray")
-            if not info_div:
-                error_message = "Info div not found"
-                self._logger.warning(error_message)
-                self._raise_parsing_error(error_message)
-
-            # Get teacher and lesson type
-            flex_divs = await info_div.query_selector_all(".d-flex.flex-wrap")
-            if len(flex_divs) < self.MIN_FLEX_CONTAINERS:
-                # Try alternative selectors
-                flex_divs = await info_div.query_selector_all("div")
-                if len(flex_divs) < self.MIN_FLEX_CONTAINERS:
-                    error_message = f"Missing flex containers, found {len(flex_divs)}"
-                    self._logger.warning(error_message)
-                    self._raise_parsing_error(error_message)
-
-            # Get teacher and lesson type
-            teacher = "Неизвестный преподаватель"
-            lesson_type_text = "Лекция"  # Default to lecture
+    def _parse_lesson(
+        self, lesson: dict[str, str | int | None], base_date: datetime
+    ) -> ScheduleEvent:
+        """Build an event from the texts extracted by ``LESSONS_JS``."""
+        if lesson["subject"] is None:
+            error_message = "Subject element not found"
+            self._raise_parsing_error(error_message)
+        if lesson["containers"] < self.MIN_FLEX_CONTAINERS:
+            error_message = f"Missing flex containers, found {lesson['containers']}"
+            self._raise_parsing_error(error_message)
 
-            try:
-                teacher_type_spans = await flex_divs[0].query_selector_all("span")
-                if len(teacher_type_spans) >= self.MIN_TEACHER_TYPE_SPANS:
-                    teacher = await teacher_type_spans[0].text_content() or teacher
-                    lesson_type_text = (
-                        await teacher_type_spans[1].text_content() or lesson_type_text
-                    )
-                else:
-                    # Try to get at least the teacher
-                    first_span = await flex_divs[0].query_selector("span")
-                    if first_span:
-                        teacher = await first_span.text_content() or teacher
-            except Exception as e:
-                self._logger.warning(f"Error parsing teacher/type: {e!s}")
-
-            # Parse time and location
-            time_text = "00:00 – 00:00"  # Default time
-            location_text = "Н-000"  # Default location
+        subject = lesson["subject"] or "Неизвестный предмет"
+        teacher = lesson["teacher"] or "Неизвестный преподаватель"
+        lesson_type_text = lesson["type"] or "Лекция"  # Default to lecture
 
-            try:
-                time_loc_spans = await flex_divs[1].query_selector_all("span")
-                if len(time_loc_spans) >= self.MIN_TIME_LOCATION_SPANS:
-                    time_span = time_loc_spans[0]
-                    loc_span = time_loc_spans[1]
-
-                    if time_span:
-                        time_content = await time_span.text_content()
-                        if time_content and "–" in time_content:
-                            time_text = time_content
-
-                    if loc_span:
-                        loc_content = await loc_span.text_content()
-                        if loc_content:
-                            location_text = loc_content
-            except Exception as e:
-                self._logger.warning(f"Error parsing time/location: {e!s}")
-
-            # Parse time
-            try:
-                start_time, end_time = self._parse_time_range(time_text)
-            except Exception as e:
-                self._logger.warning(f"Failed to parse time range '{time_text}': {e!s}")
-                # Use default times
-                start_time = time(9, 0)
-                end_time = time(10, 30)
-
-            # Parse location
-            try:
-                location = self._parse_location(location_text)
-            except Exception as e:
-                self._logger.warning(
-                    f"Failed to parse location '{location_text}': {e!s}"
-                )
-                # Use default location
-                location = Location(building="Н", room="000")
-
-            return ScheduleEvent(
-                subject=subject.strip(),
-                teacher=teacher.strip(),
-                lesson_type=self._parse_lesson_type(lesson_type_text.strip()),
-                location=location,
-                start_time=datetime.combine(base_date.date(), start_time),
-                end_time=datetime.combine(base_date.date(), end_time),
-                group="БИК2404",  # TODO: Make configurable
-            )
+        start_time, end_time = self._parse_time_range(lesson["time"] or "")
+        location = parse_location(lesson["location"] or "Н-000")
+        lesson_date = base_date.date()
 
-        except Exception as e:
-            error_message = f"Failed to parse lesson: {e}"
-            self._logger.exception(error_message)
-            raise ScrapingError(error_message) from e
+        return ScheduleEvent(
+            subject=subject.strip(),
+            teacher=teacher.strip(),
+            lesson_type=self._parse_lesson_type(lesson_type_text),
+            location=location,
+            start_time=datetime.combine(lesson_date, start_time),
+            end_time=datetime.combine(lesson_date, end_time),
+            group="БИК2404",  # TODO: Make configurable
+        )
 
     def _parse_time_range(self, time_text: str) -> tuple[time, time]:
-        """Parse time range from text."""
-        try:
-            # Clean up the text
-            time_text = time_text.strip().replace(" ", "")
-
-            # Handle different separators
-            if "–" in time_text:
-                separator = "–"
-            elif "-" in time_text:
-                separator = "-"
-            elif "—" in time_text:
-                separator = "—"
-            else:
-                raise ValueError(f"No time separator found in '{time_text}'")
-
-            start_str, end_str = time_text.split(separator)
-
-            # Clean up the time strings
-            start_str = start_str.strip()
-            end_str = end_str.strip()
-
-            # Try different time formats
-            try:
-                start_time = time.fromisoformat(start_str)
-            except ValueError:
-                # Try to parse HH:MM format
-                if ":" in start_str:
-                    hours, minutes = map(int, start_str.split(":"))
-                    start_time = time(hours, minutes)
-                else:
-                    # Default to 9:00 if parsing fails
-                    self._logger.warning(
-                        f"Could not parse start time '{start_str}', using default"
-                    )
-                    start_time = time(9, 0)
-
-            try:
-                end_time = time.fromisoformat(end_str)
-            except ValueError:
-                # Try to parse HH:MM format
-                if ":" in end_str:
-                    hours, minutes = map(int, end_str.split(":"))
-                    end_time = time(hours, minutes)
-                else:
-                    # Default to 10:30 if parsing fails
-                    self._logger.warning(
-                        f"Could not parse end time '{end_str}', using default"
-                    )
-                    end_time = time(10, 30)
-
-            # Validate that end time is after start time
-            if end_time <= start_time:
-                self._logger.warning(
-                    f"End time {end_time} is not after start time {start_time}, using default"
-                )
-                start_time = time(9, 0)
-                end_time = time(10, 30)
-
-            return start_time, end_time
-
-        except Exception as e:
-            error_message = f"Failed to parse time range '{time_text}': {e!s}"
-            self._logger.warning(error_message)
-            # Return default times
-            return time(9, 0), time(10, 30)
-
-    def _parse_location(self, location_text: str) -> Location:
-        """Parse location from text."""
-        try:
-            # Clean up the text
-            location_text = location_text.strip()
-
-            # Remove prefix if present
-            prefixes = ["Аудитория:", "Ауд.", "Ауд:", "Аудитория", "Аудитория "]
-            for prefix in prefixes:
-                if location_text.startswith(prefix):
-                    location_text = location_text.replace(prefix, "", 1).strip()
-                    break
-
-            # Handle special cases
-            if location_text.lower() in ["онлайн", "online"]:
-                return Location(building="Online", room="Online")
-
-            if "зал" in location_text.lower():
-                return Location(building="Н", room=location_text)
-
-            if "спортивный" in location_text.lower():
-                return Location(building="Н", room="Спортивный зал")
-
-            # Try to parse building and room
-            # Common format is "Н-123" or "А-123"
-            if "-" in location_text:
-                building, room = location_text.split("-", 1)
-                building = building.strip()
-                room = room.strip()
-
-                # Validate building
-                if building not in ["Н", "А"]:
-                    building = "Н"  # Default to Н
-
-                return Location(building=building, room=room)
-            # If no building specified, assume it's in the default building
-            return Location(building="Н", room=location_text)
-
-        except Exception as e:
-            error_message = f"Failed to parse location '{location_text}': {e!s}"
-            self._logger.warning(error_message)
-            # Return default location
-            return Location(building="Н", room="000")
+        """Parse time range from text, falling back to a default slot."""
+        time_range = match_time_range(time_text)
+        if time_range is None:
+            self._logger.warning(
+                "Could not parse time range, using default", text=time_text
+            )
+            return DEFAULT_TIME_RANGE
+        return time_range
 
     def _parse_lesson_type(self, type_text: str) -> LessonType:
         """Parse lesson type from text."""
         # Clean up the text
         type_text = type_text.strip()
 
-        # Direct mapping
-        type_mapping = {
-            "Лекция": LessonType.LECTURE,
-            "Практическое занятие": LessonType.PRACTICE,
-            "Практика": LessonType.PRACTICE,
-            "Лабораторная работа": LessonType.LAB,
-            "Лабораторная": LessonType.LAB,
-        }
-
         # Try direct match first
-        if type_text in type_mapping:
-            return type_mapping[type_text]
+        lesson_type = LESSON_TYPES.get(type_text)
+        if lesson_type is not None:
+            return lesson_type
 
         # Try partial matching
         type_text_lower = type_text.lower()
@@ -501,117 +502,267 @@ class ScheduleParser:
             return LessonType.LAB
 
         # Log warning and default to lecture
-        self._logger.warning(f"Unknown lesson type: {type_text}, defaulting to lecture")
+        self._logger.warning(
+            "Unknown lesson type, defaulting to lecture", type_text=type_text
+        )
         return LessonType.LECTURE
 
 
 class MTUCIScheduleScraper:
     """Main scraper class for MTUCI schedule."""
 
+    RETRY_BASE_DELAY = 1  # seconds
+    RETRY_MAX_DELAY = 30  # seconds
+    # Retrying these cannot help: the credentials or the form input are wrong,
+    # or MTUCI is known to be down. Repeated bad logins may also lock the account
+    NON_RETRYABLE_ERRORS = (
+        AuthValidationError,
+        InvalidCredentialsError,
+        CircuitOpenError,
+    )
+
     def __init__(
-        self, auth_config: AuthConfig, max_retries: int = 5, timeout_ms: int = 60000
+        self,
+        auth_config: AuthConfig,
+        max_retries: int = 5,
+        timeout_ms: int = 60000,
+        max_concurrent_pages: int = 3,
+        total_timeout_ms: int | None = None,
     ):
         """Initialize scraper with configuration."""
         self.auth_config = auth_config
         self.max_retries = max_retries
         self.timeout_ms = timeout_ms
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        # One budget for the whole run, step timeouts and retries included
+        self.total_timeout_ms = total_timeout_ms
+        # Bulkhead: every run already opens several pages, more runs than
+        # this at once would only hammer MTUCI. Its semaphore is created by
+        # the first run, so it belongs to the event loop the runs share
+        self.max_concurrent_runs = 2
+        self._bulkhead: asyncio.Semaphore | None = None
+        # Optional source of events for when MTUCI stays unreachable
+        self.fallback_provider: ScheduleFallback | None = None
+        # Optional fault injection for exercising the failure paths
+        self.fault_injector: FaultInjector | None = None
+        self._authenticator = MTUCIAuthenticator(auth_config)
         self._logger = logger.bind(component="MTUCIScheduleScraper")
 
     async def _setup_page(self, page: Page) -> None:
         """Setup page and authenticate."""
         try:
-            # Authenticate
-            authenticator = MTUCIAuthenticator(self.auth_config)
-            await authenticator.authenticate(page)
+            if self.fault_injector:
+                await self.fault_injector.maybe_inject("setup")
 
-            # Use the authenticator's navigate_to_schedule method which has improved retry logic
-            await authenticator.navigate_to_schedule(page)
-
-            # Additional waiting for dynamic content with a more generous timeout
-            try:
-                # Try a less strict wait condition first
-                await page.wait_for_load_state("load", timeout=self.timeout_ms)
-                self._logger.info("Page load state reached")
-
-                # Then try networkidle, but don't fail if it times out
-                try:
-                    await page.wait_for_load_state(
-                        "networkidle", timeout=self.timeout_ms // 2
-                    )
-                    self._logger.info("Page fully loaded (networkidle state reached)")
-                except PlaywrightError as e:
-                    # Log but don't fail if this times out - the page might still be usable
-                    self._logger.warning(
-                        "Networkidle state not reached, continuing anyway", error=str(e)
-                    )
+            # Authenticate
+            await self._authenticator.authenticate(page)
 
-                # Verify we can see schedule elements
-                schedule_elements = [
-                    ".schedule-month",
-                    ".button-day",
-                    ".schedule-lessons",
-                    "h4.current-day",
-                ]
-
-                for selector in schedule_elements:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element:
-                            self._logger.debug(f"Found schedule element: {selector}")
-                            break
-                    except PlaywrightError:
-                        continue
-
-            except PlaywrightError as e:
-                # Even if waiting for load state fails, try to continue
-                self._logger.warning(
-                    "Load state not reached, attempting to continue", error=str(e)
-                )
+            # The authenticator retries the schedule navigation by itself
+            await self._authenticator.navigate_to_schedule(page)
 
-                # Add a small delay to allow for any dynamic content to load
-                await asyncio.sleep(2)
+            await self._wait_for_day_buttons(page)
 
         except Exception as e:
             error_message = "Failed to setup page"
             self._logger.exception(error_message, error=str(e))
             raise ApplicationError(error_message) from e
 
-    async def parse_schedule(self, page: Page) -> list[ScheduleEvent]:
-        """Parse complete schedule."""
+    async def _wait_for_day_buttons(self, page: Page) -> None:
+        """Wait for the day buttons of the schedule page to render."""
+        # The parser starts from the day buttons, so waiting for them is
+        # enough; networkidle can take seconds to fire on this SPA
         try:
-            # Setup page and authenticate
-            await self._setup_page(page)
+            await page.wait_for_selector(
+                ".button-day", state="attached", timeout=self.timeout_ms
+            )
+            self._logger.info("Schedule day buttons rendered")
+        except PlaywrightError as e:
+            # Even if the buttons do not show up in time, try to continue
+            self._logger.warning(
+                "Day buttons not found, attempting to continue", error=str(e)
+            )
 
-            # Create parser and get available dates
-            parser = ScheduleParser(page)
-            dates = await parser.get_available_dates()
+    async def parse_schedule(self, page: Page) -> list[ScheduleEvent]:
+        """
+        Parse complete schedule.
 
-            self._logger.info(
-                "Found available dates", dates=[d.strftime("%Y-%m-%d") for d in dates]
-            )
+        Failed attempts are retried on the same page, up to ``max_retries``
+        times, so the browser is started only once per sync. Runs beyond
+        ``max_concurrent_runs`` wait for a free slot. With ``total_timeout_ms``
+        set, the whole run, waiting included, is cancelled once it runs out.
+
+        If every attempt fails and a ``fallback_provider`` is configured, its
+        events are returned instead of raising.
+        """
+        try:
+            return await self._parse_schedule_bounded(page)
+        except ApplicationError as e:
+            if self.fallback_provider is None:
+                raise
+            self._logger.warning("Schedule unavailable, using fallback", error=str(e))
+            return await self.fallback_provider()
+
+    async def _parse_schedule_bounded(self, page: Page) -> list[ScheduleEvent]:
+        """Parse the schedule inside the bulkhead and the end-to-end deadline."""
+        timeout = (
+            self.total_timeout_ms / 1000 if self.total_timeout_ms is not None else None
+        )
+        if self._bulkhead is None:
+            self._bulkhead = asyncio.Semaphore(max(1, self.max_concurrent_runs))
+        try:
+            async with asyncio.timeout(timeout), self._bulkhead:
+                return await self._parse_schedule_with_retries(page)
+        except TimeoutError as e:
+            error_message = "Schedule parsing deadline exceeded"
+            self._logger.exception(error_message, timeout_ms=self.total_timeout_ms)
+            raise ScrapingError(error_message) from e
 
-            # Parse schedule for each date
-            all_events = []
-            for date in dates:
+    async def _parse_schedule_with_retries(self, page: Page) -> list[ScheduleEvent]:
+        """Parse the schedule, retrying transient failures with backoff."""
+        try:
+            for attempt in range(1, self.max_retries + 1):
                 try:
-                    events = await parser.parse_day(date)
-                    self._logger.info(
-                        "Parsed schedule",
-                        date=date.strftime("%Y-%m-%d"),
-                        events_count=len(events),
-                    )
-                    all_events.extend(events)
-                except ScrapingError as e:
-                    self._logger.exception(
-                        "Failed to parse date",
-                        date=date.strftime("%Y-%m-%d"),
+                    return await self._parse_schedule_once(page)
+                except (ApplicationError, PlaywrightError) as e:
+                    if attempt == self.max_retries or not self._is_retryable(e):
+                        raise
+
+                    # Full jitter keeps retries of concurrent runs from lining up
+                    backoff = self.RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                    delay = random.uniform(0, min(self.RETRY_MAX_DELAY, backoff))  # noqa: S311
+                    self._logger.warning(
+                        "Schedule parsing attempt failed, retrying",
+                        attempt=attempt,
+                        max_retries=self.max_retries,
+                        delay=round(delay, 2),
                         error=str(e),
                     )
-                    continue
+                    await asyncio.sleep(delay)
 
-            return sorted(all_events, key=lambda x: x.start_time)
+            # Only reachable with max_retries < 1
+            error_message = "No schedule parsing attempts made"
+            raise ScrapingError(error_message)
 
         except Exception as e:
             error_message = "Schedule parsing failed"
             self._logger.exception(error_message, error=str(e))
             raise ApplicationError(error_message) from e
+
+    def _is_retryable(self, error: BaseException) -> bool:
+        """Check that no error in the cause chain rules out a retry."""
+        while error is not None:
+            if isinstance(error, self.NON_RETRYABLE_ERRORS):
+                return False
+            error = error.__cause__
+        return True
+
+    async def _parse_schedule_once(self, page: Page) -> list[ScheduleEvent]:
+        """Authenticate, open the schedule and parse every available date."""
+        # Setup page and authenticate
+        await self._setup_page(page)
+
+        # The parser holds a CDP session, detach it however the attempt ends
+        parser = ScheduleParser(page, self.fault_injector)
+        try:
+            return await self._parse_dates(page, parser)
+        finally:
+            await parser.close()
+
+    async def _parse_dates(
+        self, page: Page, parser: ScheduleParser
+    ) -> list[ScheduleEvent]:
+        """Parse every available date, using ``parser`` on the main page."""
+        date_buttons = await parser.get_date_buttons()
+
+        self._logger.info(
+            "Found available dates",
+            dates=[d.strftime("%Y-%m-%d") for d, _ in date_buttons],
+        )
+
+        # Parse dates concurrently: the authenticated page plus extra pages
+        # opened in the same context, all pulling from a shared queue.
+        # Every page shows the same week, so button indexes carry over
+        queue: asyncio.Queue[tuple[datetime, int]] = asyncio.Queue()
+        for date_button in date_buttons:
+            queue.put_nowait(date_button)
+
+        extra_pages = max(0, min(self.max_concurrent_pages, len(date_buttons)) - 1)
+        # One list per worker, filled as days are parsed so that a failing
+        # worker still hands over the days it finished
+        results: list[list[ScheduleEvent]] = [[] for _ in range(extra_pages + 1)]
+        try:
+            # A failure of the main page fails the attempt and cancels the
+            # other workers, which would otherwise outlive it
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(
+                    self._parse_queued_dates(parser, queue, results[0])
+                )
+                for worker_events in results[1:]:
+                    task_group.create_task(
+                        self._parse_queued_dates_on_new_page(page, queue, worker_events)
+                    )
+        except ExceptionGroup as e:
+            # Only the main page lets errors escape, re-raise it for the retry
+            raise e.exceptions[0]  # noqa: B904
+
+        # Dates given back by a failed worker after the others had finished
+        if not queue.empty():
+            leftover_events: list[ScheduleEvent] = []
+            await self._parse_queued_dates(parser, queue, leftover_events)
+            results.append(leftover_events)
+
+        # Given back dates are parsed after later ones, so sort the union
+        return sorted(chain.from_iterable(results), key=_by_start_time)
+
+    async def _parse_queued_dates(
+        self,
+        parser: ScheduleParser,
+        queue: asyncio.Queue[tuple[datetime, int]],
+        all_events: list[ScheduleEvent],
+    ) -> None:
+        """Parse dates from the queue into ``all_events`` until it is empty."""
+        while not queue.empty():
+            date_button = queue.get_nowait()
+            date = date_button[0]
+            try:
+                events = await parser.parse_day(*date_button)
+            except ScrapingError as e:
+                self._logger.exception(
+                    "Failed to parse date",
+                    date=date.strftime("%Y-%m-%d"),
+                    error=str(e),
+                )
+                continue
+            except PlaywrightError:
+                # The page itself is broken, leave the date to the others
+                queue.put_nowait(date_button)
+                raise
+
+            self._logger.info(
+                "Parsed schedule",
+                date=date.strftime("%Y-%m-%d"),
+                events_count=len(events),
+            )
+            all_events.extend(events)
+
+    async def _parse_queued_dates_on_new_page(
+        self,
+        page: Page,
+        queue: asyncio.Queue[tuple[datetime, int]],
+        all_events: list[ScheduleEvent],
+    ) -> None:
+        """Open another schedule page in the same session and help drain the queue."""
+        # Pages of one context share cookies, so no second login is needed
+        worker_page = await page.context.new_page()
+        parser = ScheduleParser(worker_page, self.fault_injector)
+        try:
+            await self._authenticator.navigate_to_schedule(worker_page)
+            # Buttons are clicked by index, so they have to be there first
+            await self._wait_for_day_buttons(worker_page)
+            await self._parse_queued_dates(parser, queue, all_events)
+        except (ApplicationError, AuthenticationError, PlaywrightError) as e:
+            # Dates left in the queue are picked up by the remaining workers
+            self._logger.warning("Worker page failed", error=str(e))
+        finally:
+            await parser.close()
+            await worker_page.close()
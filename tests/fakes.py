@@ -0,0 +1,114 @@
+# tests/fakes.py
+"""Stand-ins for the browser, so the real parsing code runs in tests."""
+
+import asyncio
+from datetime import UTC
+from datetime import datetime
+
+from playwright.async_api import Error as PlaywrightError
+
+from src.scraping.schedule_scraper import DAY_BUTTON_TEXTS_JS
+
+PAGE_CLOSED = "Target page, context or browser has been closed"
+NO_CDP = "CDP sessions are only supported on Chromium"
+# Day buttons carry no year, the parser assumes the current one
+DATES = [
+    datetime(datetime.now(UTC).year, 11, day, tzinfo=UTC) for day in (11, 12, 13, 14)
+]
+LESSON = {
+    "subject": "Высшая математика",
+    "containers": 2,
+    "teacher": "Лакерник Александр Рафаилович",
+    "type": "Лекция",
+    "time": "9:30 - 11:05",
+    "location": "Н-310",
+}
+
+
+class FakeAuthenticator:
+    """Authenticator that is always logged in and on the schedule page."""
+
+    def __init__(self) -> None:
+        self.logins = 0
+
+    async def authenticate(self, page: object) -> None:
+        self.logins += 1
+
+    async def navigate_to_schedule(self, page: object) -> None:
+        pass
+
+
+class FakeContext:
+    """Browser context whose new pages break on the given day click."""
+
+    def __init__(self, breaks_on_click: int | None = None) -> None:
+        self.breaks_on_click = breaks_on_click
+        self.pages: list[FakePage] = []
+
+    async def new_page(self) -> "FakePage":
+        page = FakePage(self, self.breaks_on_click)
+        self.pages.append(page)
+        return page
+
+    async def new_cdp_session(self, page: object) -> None:
+        # The parser falls back to page.evaluate, which FakePage answers
+        raise PlaywrightError(NO_CDP)
+
+
+class FakeDayButton:
+    def __init__(self, page: "FakePage") -> None:
+        self.page = page
+
+    def nth(self, index: int) -> "FakeDayButton":
+        return self
+
+    async def click(self) -> None:
+        await self.page.click_day()
+
+
+class FakePage:
+    """
+    Schedule page showing one lesson on each of ``DATES``.
+
+    The page gets closed on its ``breaks_on_click``-th day button click, like a
+    crashed tab, so that click and every later one fail.
+    """
+
+    url = "https://lk.mtuci.ru/student/schedule"
+
+    def __init__(
+        self, context: FakeContext, breaks_on_click: int | None = None
+    ) -> None:
+        self.context = context
+        self.breaks_on_click = breaks_on_click
+        self.clicks = 0
+        self.closed = False
+
+    def locator(self, selector: str) -> FakeDayButton:
+        return FakeDayButton(self)
+
+    async def click_day(self) -> None:
+        self.clicks += 1
+        if self.clicks == self.breaks_on_click:
+            self.closed = True
+        if self.closed:
+            raise PlaywrightError(PAGE_CLOSED)
+        # Give the other pages a turn, like a real round-trip would
+        await asyncio.sleep(0)
+
+    async def evaluate(self, function: str) -> list:
+        if function == DAY_BUTTON_TEXTS_JS:
+            return [date.strftime("Пн %d.%m") for date in DATES]
+        return [LESSON]
+
+    async def wait_for_load_state(self, *args: object, **kwargs: object) -> None:
+        pass
+
+    async def wait_for_function(self, *args: object, **kwargs: object) -> None:
+        pass
+
+    async def wait_for_selector(self, *args: object, **kwargs: object) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
@@ -0,0 +1,88 @@
+# tests/test_chaos.py
+import asyncio
+
+import pytest
+
+from src.core.chaos import FaultInjector
+from src.scraping.auth import AuthConfig
+from src.scraping.schedule_scraper import MTUCIScheduleScraper
+from src.scraping.schedule_scraper import ScheduleParser
+from tests.fakes import DATES
+from tests.fakes import FakeAuthenticator
+from tests.fakes import FakeContext
+from tests.fakes import FakePage
+
+# With rate 0.5, seed 4 fails the first call with a timeout and passes the second
+RETRY_SEED = 4
+# With rate 0.3, seed 22 passes the first call, fails the second with a
+# timeout and passes the next five
+NAVIGATION_SEED = 22
+
+
+async def no_date_buttons(self: ScheduleParser) -> list:
+    return []
+
+
+def make_scraper(injector: FaultInjector) -> MTUCIScheduleScraper:
+    scraper = MTUCIScheduleScraper(
+        AuthConfig(email="student@mtuci.ru", password="secret"),
+        max_retries=3,
+        max_concurrent_pages=1,
+    )
+    scraper.RETRY_BASE_DELAY = 0
+    scraper.fault_injector = injector
+    scraper._authenticator = FakeAuthenticator()
+    return scraper
+
+
+def count_attempts(scraper: MTUCIScheduleScraper) -> list[int]:
+    """Count the calls of ``scraper._parse_schedule_once`` in the returned list."""
+    attempts = [0]
+    parse_schedule_once = scraper._parse_schedule_once
+
+    async def counted(page: FakePage) -> list:
+        attempts[0] += 1
+        return await parse_schedule_once(page)
+
+    scraper._parse_schedule_once = counted
+    return attempts
+
+
+def test_same_seed_injects_same_faults() -> None:
+    async def run(seed: int) -> list[str]:
+        injector = FaultInjector(rate=0.5, seed=seed)
+        injector.SLOW_DELAY = 0
+        outcomes = []
+        for _ in range(20):
+            try:
+                await injector.maybe_inject("step")
+                outcomes.append("ok")
+            except Exception as e:  # noqa: BLE001
+                outcomes.append(type(e).__name__)
+        return outcomes
+
+    assert asyncio.run(run(1)) == asyncio.run(run(1))
+
+
+def test_setup_fault_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ScheduleParser, "get_date_buttons", no_date_buttons)
+    scraper = make_scraper(FaultInjector(rate=0.5, seed=RETRY_SEED))
+    attempts = count_attempts(scraper)
+
+    assert asyncio.run(scraper.parse_schedule(FakePage(FakeContext()))) == []
+    # The first attempt failed before logging in, the retry went through
+    assert attempts == [2]
+    assert scraper._authenticator.logins == 1
+
+
+def test_navigation_fault_is_retried() -> None:
+    scraper = make_scraper(FaultInjector(rate=0.3, seed=NAVIGATION_SEED))
+    attempts = count_attempts(scraper)
+
+    events = asyncio.run(scraper.parse_schedule(FakePage(FakeContext())))
+
+    # The fault on the first day failed the attempt instead of dropping the day
+    assert attempts == [2]
+    assert [event.start_time.date() for event in events] == [
+        date.date() for date in DATES
+    ]
@@ -0,0 +1,99 @@
+# tests/test_circuit_breaker.py
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import circuit_breaker
+from src.core.circuit_breaker import CircuitBreaker
+from src.core.circuit_breaker import CircuitOpenError
+from src.core.circuit_breaker import CircuitState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(
+        circuit_breaker, "time", SimpleNamespace(monotonic=fake.monotonic)
+    )
+    return fake
+
+
+def open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker("lk.mtuci.ru", failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_threshold(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("lk.mtuci.ru", failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.check()
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_success_resets_failure_count(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("lk.mtuci.ru", failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_lets_one_probe_through(clock: FakeClock) -> None:
+    breaker = open_breaker()
+    clock.now += 60
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    breaker.check()
+    # Concurrent callers wait for the probe instead of probing too
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_successful_probe_closes(clock: FakeClock) -> None:
+    breaker = open_breaker()
+    clock.now += 60
+    breaker.check()
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    breaker.check()
+    breaker.check()
+
+
+def test_failed_probe_reopens(clock: FakeClock) -> None:
+    breaker = open_breaker()
+    clock.now += 60
+    breaker.check()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    clock.now += 59
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    clock.now += 1
+    breaker.check()
+
+
+def test_lost_probe_is_given_up_on(clock: FakeClock) -> None:
+    breaker = open_breaker()
+    clock.now += 60
+    breaker.check()
+
+    # The probe never reported back, e.g. it was cancelled
+    clock.now += 60
+    breaker.check()
@@ -0,0 +1,78 @@
+# tests/test_schedule_scraper.py
+import asyncio
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+from src.models.schedule import LessonType
+from src.models.schedule import ScheduleEvent
+from src.scraping.auth import AuthConfig
+from src.scraping.schedule_scraper import MTUCIScheduleScraper
+from src.scraping.schedule_scraper import ScheduleParser
+from tests.fakes import DATES
+from tests.fakes import FakeAuthenticator
+from tests.fakes import FakeContext
+from tests.fakes import FakePage
+
+
+def make_scraper() -> MTUCIScheduleScraper:
+    scraper = MTUCIScheduleScraper(
+        AuthConfig(email="student@mtuci.ru", password="secret"),
+        max_retries=1,
+        max_concurrent_pages=2,
+    )
+    scraper._authenticator = FakeAuthenticator()
+    return scraper
+
+
+def event_dates(events: list[ScheduleEvent]) -> list:
+    return [event.start_time.date() for event in events]
+
+
+def test_broken_page_gives_its_date_back() -> None:
+    parser = ScheduleParser(FakePage(FakeContext(), breaks_on_click=2))
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, date in enumerate(DATES[:3]):
+        queue.put_nowait((date, index))
+    events: list[ScheduleEvent] = []
+
+    with pytest.raises(PlaywrightError):
+        asyncio.run(make_scraper()._parse_queued_dates(parser, queue, events))
+
+    # The day parsed before the failure is kept, the failed one is queued again
+    assert event_dates(events) == [DATES[0].date()]
+    assert sorted(queue.get_nowait() for _ in range(queue.qsize())) == [
+        (DATES[1], 1),
+        (DATES[2], 2),
+    ]
+
+
+def test_failed_worker_page_keeps_parsed_days() -> None:
+    # Worker pages break on their second day, the main page never does
+    context = FakeContext(breaks_on_click=2)
+
+    events = asyncio.run(make_scraper()._parse_schedule_once(FakePage(context)))
+
+    assert event_dates(events) == [date.date() for date in DATES]
+    assert all(page.closed for page in context.pages)
+
+
+def test_broken_main_page_fails_the_attempt() -> None:
+    main_page = FakePage(FakeContext(), breaks_on_click=1)
+
+    # Raised for the retry instead of returning the other pages' days
+    with pytest.raises(PlaywrightError):
+        asyncio.run(make_scraper()._parse_schedule_once(main_page))
+
+
+@pytest.mark.parametrize(
+    ("type_text", "expected"),
+    [
+        ("Лекция", LessonType.LECTURE),
+        ("Лабораторная практика", LessonType.PRACTICE),
+        ("Практика (лекционная)", LessonType.LECTURE),
+        ("лаб. работа", LessonType.LAB),
+    ],
+)
+def test_lesson_type_stems_keep_priority(type_text: str, expected: LessonType) -> None:
+    assert ScheduleParser(None)._parse_lesson_type(type_text) is expected